@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
 import datetime as dt
+import email.utils
+import functools
+import math
+import operator
+import random
+import string
 import sys
+import threading
 import time
+import types
 import typing
 import weakref
 
-import requests
-import rich.progress
-
 import spess.client
 import spess.config
 import spess._json
@@ -19,17 +26,23 @@ import spess._paged
 import spess._rate_limit
 import spess.responses
 
+if typing.TYPE_CHECKING:
+    import requests
+    import rich.progress
+
 #: Set to False to turn off interactive waits.
 _wait_interactive: bool = True
 
+def _wait_amount(*expirations: dt.datetime | None) -> float:
+    # read the wall clock once, and leave the rest to monotonic sleeps
+    expiration = max(e for e in expirations if e is not None)
+    return (expiration - dt.datetime.now(dt.UTC)).total_seconds() + 1.0
+
 def _wait(*expirations: dt.datetime | None, message: str | None = None) -> None:
     """Backend for model wait methods."""
     if message is None:
         message = 'waiting'
-    expiration = max(e for e in expirations if e is not None)
-    start = dt.datetime.now(dt.UTC)
-    expiration += dt.timedelta(seconds=1)
-    amt = (expiration - start).total_seconds()
+    amt = _wait_amount(*expirations)
 
     if amt < 0:
         return
@@ -38,29 +51,81 @@ def _wait(*expirations: dt.datetime | None, message: str | None = None) -> None:
         time.sleep(amt)
         return
 
-    prog = rich.progress.Progress(
+    # rich redraws on its own thread, so there's nothing to do but sleep
+    with _progress_task(message, amt):
+        time.sleep(amt)
+
+# one progress display, shared by every interactive wait. it only runs
+# while a wait is in progress, so it stays out of the way of the REPL
+_progress: rich.progress.Progress | None = None
+_progress_lock = threading.Lock()
+_progress_users = 0
+
+def _make_progress() -> rich.progress.Progress:
+    # rich is slow to import, and only interactive waits need it
+    import rich.progress
+    import rich.text
+
+    class RemainingColumn(rich.progress.ProgressColumn):
+        """Time remaining, from the task's total and elapsed time alone,
+        so the task never needs progress updates."""
+
+        def render(self, task: rich.progress.Task) -> rich.text.Text:
+            remaining = 0
+            if task.total is not None and task.elapsed is not None:
+                remaining = max(0, int(task.total - task.elapsed))
+            return rich.text.Text(str(dt.timedelta(seconds=remaining)), style='progress.remaining')
+
+    return rich.progress.Progress(
         rich.progress.SpinnerColumn(),
         rich.progress.TextColumn('[progress.description]{task.description}'),
-        rich.progress.TimeRemainingColumn(),
+        RemainingColumn(),
+        refresh_per_second=8,
+        transient=True,
     )
 
-    with prog:
-        task = prog.add_task(message if message else 'waiting', total=amt)
-        while True:
-            now = dt.datetime.now(dt.UTC)
-            elapsed = (now - start).total_seconds()
-            prog.update(task, completed=elapsed)
-            if now > expiration:
-                return
-            time.sleep(1)
-
-async def _await(*expirations: dt.datetime | None) -> None:
+@contextlib.contextmanager
+def _progress_task(message: str, total: float) -> typing.Iterator[None]:
+    global _progress, _progress_users
+    with _progress_lock:
+        if _progress is None:
+            _progress = _make_progress()
+        prog = _progress
+        if _progress_users == 0:
+            prog.start()
+        _progress_users += 1
+        task = prog.add_task(message, total=total)
+
+    try:
+        yield
+    finally:
+        with _progress_lock:
+            prog.remove_task(task)
+            _progress_users -= 1
+            if _progress_users == 0:
+                prog.stop()
+
+def _await(*expirations: dt.datetime | None, wake: set[asyncio.Event] | None = None) -> typing.Generator[typing.Any, None, None]:
     """Backend for model __await__ methods."""
-    expiration = max(e for e in expirations if e is not None)
-    start = dt.datetime.now(dt.UTC)
-    expiration += dt.timedelta(seconds=1)
-    amt = (expiration - start).total_seconds()
-    await asyncio.sleep(amt)
+    return _await_async(*expirations, wake=wake).__await__()
+
+async def _await_async(*expirations: dt.datetime | None, wake: set[asyncio.Event] | None = None) -> None:
+    amt = max(0, _wait_amount(*expirations))
+
+    if wake is None:
+        await asyncio.sleep(amt)
+        return
+
+    # wake up early if someone calls cancel_wait(). the event is made
+    # here, so it always belongs to the running loop
+    event = asyncio.Event()
+    wake.add(event)
+    try:
+        await asyncio.wait_for(event.wait(), timeout=amt)
+    except TimeoutError:
+        pass
+    finally:
+        wake.discard(event)
 
 class Error(Exception):
     """Base error class thrown by :class:`spess.client.Client`."""
@@ -68,19 +133,23 @@ class Error(Exception):
     #: The error code reported by the server, if any.
     code: int | None
 
-    def __init__(self, code: int | None = None, message: str | None = None):
-        m = ''
-        if code is not None and message is not None:
-            m = f'(code {code}) {message}'
-        elif code is not None:
-            m = f'code {code}'
-        elif message is not None:
-            m = message
-        else:
-            m = 'unknown'
+    #: The error message reported by the server, if any.
+    message: str | None
 
-        super().__init__(m)
+    def __init__(self, code: int | None = None, message: str | None = None):
+        # keep args as given, so the error pickles and round-trips. the
+        # message is only formatted if something actually prints it
+        super().__init__(code, message)
         self.code = code
+        self.message = message
+
+    def __str__(self) -> str:
+        code, message = self.code, self.message
+        if code is None:
+            return 'unknown' if message is None else message
+        if message is None:
+            return f'code {code}'
+        return f'(code {code}) {message}'
 
 class ParseError(Error):
     """ParseError indicates that the server provided a response, but
@@ -103,10 +172,78 @@ class NoContentError(Error):
     appropriate.
     """
 
+@functools.lru_cache(maxsize=512)
+def _compile_path(path: str) -> typing.Callable[[typing.Mapping[str, str | None]], str]:
+    # these are the same few dozen endpoint paths, over and over, so
+    # parse each once into a %-template and a getter for its arguments
+    template = ''
+    names = []
+    for literal, name, spec, conversion in string.Formatter().parse(path):
+        template += literal.replace('%', '%%')
+        if name is None:
+            continue
+        if conversion or spec not in ('', 's'):
+            # not a plain string substitution, so leave it to format
+            return path.format_map
+        template += '%s'
+        names.append(name)
+
+    if not names:
+        return lambda args: path
+    if len(names) == 1:
+        name = names[0]
+        return lambda args: template % (args[name],)
+    getter = operator.itemgetter(*names)
+    return lambda args: template % getter(args)
+
+def _without_none[V](d: dict[str, V]) -> dict[str, V]:
+    # usually there's nothing to filter, so skip the copy
+    if None not in d.values():
+        return d
+    return {k: v for k, v in d.items() if v is not None}
+
+def _parse_retry_after(value: str | None) -> float:
+    # spacetraders sends (possibly fractional) seconds, but http also
+    # allows a date. anything nonsensical is ignored, as if absent
+    if not value:
+        return 0.0
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+            if when.tzinfo is None:
+                # http dates are always in UTC
+                when = when.replace(tzinfo=dt.UTC)
+            seconds = (when - dt.datetime.now(dt.UTC)).total_seconds()
+        except (TypeError, ValueError, OverflowError):
+            return 0.0
+    if not math.isfinite(seconds) or seconds < 0:
+        return 0.0
+    return seconds
+
+# set when a request's rate limit slot was already taken by call_async
+_limit_prepaid: contextvars.ContextVar[bool] = contextvars.ContextVar('_limit_prepaid', default=False)
+
+# shared, read-only stand-in for a type with no aliases
+_NO_ALIASES: typing.Mapping[str, str] = types.MappingProxyType({})
+
 class Backend:
     #: The default base url to use for requests.
     SERVER_URL: typing.ClassVar[str]
 
+    # retry policy for rate limits, flaky gateways and failed connections.
+    # each retry waits base * 2**attempt (at most cap) plus up to base
+    # of jitter, or longer if the server asks for it. if it asks for
+    # more than cap, the error is raised instead
+    _retry_attempts: typing.ClassVar[int] = 5
+    _retry_base: typing.ClassVar[float] = 1.0
+    _retry_cap: typing.ClassVar[float] = 60.0
+    _retry_status: typing.ClassVar[frozenset[int]] = frozenset({429, 502, 503, 504})
+    # a bad gateway or timeout may come after the server already acted,
+    # so writes only retry when they surely were not handled
+    _retry_status_write: typing.ClassVar[frozenset[int]] = frozenset({429, 503})
+
     config: spess.config.Config
     account_token: spess.models.Token | None
     agent_token: spess.models.Token | None
@@ -117,8 +254,13 @@ class Backend:
     _limit: spess._rate_limit.Limiter
     _reset_date: dt.date
 
-    _aliases: dict[tuple[type[bases.Keyed], str], str]
+    _aliases: dict[type[bases.Keyed], dict[str, str]]
     _sync_table: weakref.WeakValueDictionary[tuple[type[bases.Synced], str], bases.Synced]
+    # the object each payload synced into, and its version just after
+    _last_payload: dict[tuple[type, str, tuple[tuple[str, str | None], ...]], tuple[int, spess._json.Json, weakref.ref[typing.Any]]]
+    # how many of the most recent payloads to remember
+    _last_payload_max: typing.ClassVar[int] = 256
+    _cache: dict[tuple[str | bytes | None, str, tuple[tuple[str, str | None], ...]], tuple[float, bytes]]
 
     def __init__(
             self,
@@ -133,20 +275,43 @@ class Backend:
         # set up state
         self._aliases = {}
         self._sync_table = weakref.WeakValueDictionary()
+        self._sync_lock = threading.Lock()
+        self._last_payload = {}
+        self._cache = {}
 
         # begin bringing up the http side
-        self._session = requests.Session()
-        self._session.headers['User-Agent'] = f'{__package__}/{spess.__version__}'
+        self._session = self._make_session()
+
+        # resolved once, these are used on every request
+        self._base_url = (self.config.url or self.SERVER_URL).lstrip('/')
+        self._request = self._session.request
 
-        # spacetrader limits to 2 per second, 30 in 60s
+        # spacetrader limits to 2 per second, with bursts up to 30
+        # one bucket covers both, and only needs one timer and one lock
         # put a 5% margin on it to be safe
-        self._limit = spess._rate_limit.Any(
-            spess._rate_limit.ConstantRate(2, margin=0.05),
-            spess._rate_limit.Windowed(30, 60.0, margin=0.05),
-        ).synced()
+        self._limit = spess._rate_limit.LeakyBucket(2, 30, margin=0.05).synced()
 
+        self._auth_lock = threading.Lock()
         self._load_tokens()
 
+    def _make_session(self) -> requests.Session:
+        # the one place the transport is built, so a subclass can swap
+        # in a different session (or adapter) without touching the rest.
+        # requests is slow to import, so wait until a client needs it
+        import requests
+        import requests.adapters
+
+        session = requests.Session()
+        session.headers['User-Agent'] = f'{__package__}/{spess.__version__}'
+
+        # everything goes to one host, so keep a deep pool of live
+        # connections to it. retries are handled in _send, not here, so
+        # that they go through the rate limiter
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
     def _load_tokens(self) -> None:
         # grab some information and also test connection
         self._reset_date = self.status().reset_date
@@ -169,8 +334,23 @@ class Backend:
                 raise
 
         # later on, choose this method-by-method, but for now...
-        if self.agent_token:
-            self._session.headers['Authorization'] = f'Bearer {self.agent_token.token}'
+        self._set_authorization(self.agent_token)
+
+    def _set_authorization(self, token: spess.models.Token | None) -> None:
+        # requests in flight on other threads read these headers, so
+        # only touch them when the token actually changes. with no
+        # token, drop any stale header from a previous load
+        header = f'Bearer {token.token}' if token else None
+        with self._auth_lock:
+            headers = self._session.headers
+            if headers.get('Authorization') == header:
+                return
+            if header is None:
+                del headers['Authorization']
+            else:
+                headers['Authorization'] = header
+            # cached responses belong to whoever was signed in
+            self._cache.clear()
 
     def _debug(self, *args, **kwargs):
         if self.debug:
@@ -191,35 +371,33 @@ class Backend:
             query_args: dict[str, str | None] = {},
             body: spess._json.Json = None,
     ) -> spess._json.Json:
-        # resolve the url
-        base_url = self.SERVER_URL
-        if self.config.url:
-            base_url = self.config.url
-        url = base_url.lstrip('/') + path
+        url = self._base_url + path
 
         self._debug('>>>', url, query_args, body)
 
-        # wrap the whole request here so we can retry later
-        def do_request() -> requests.Response:
-            self._limit.limit()
-            return self._session.request(method, url, params=query_args, json=body)
-
-        r = do_request()
-
-        # rate limit failure
-        if r.status_code == 429:
-            # attempt to parse the retry-after header as seconds
-            # spacetraders always seems to use seconds, not http dates
-            retrystr = r.headers.get('retry-after', '2')
-            try:
-                retry = float(retrystr)
-            except Exception:
-                # use a conservative guess
-                retry = 2
-
-            # wait a reasonable amount of time for HTTP and try *once* more
-            time.sleep(retry)
-            r = do_request()
+        # serve repeated GETs from the cache, if it's enabled. anything
+        # else might change server state, so it empties the cache
+        cache_key = None
+        if method != 'get':
+            self._cache.clear()
+        elif self.config.cache_ttl > 0:
+            # keyed on the token too, in case a request made before a
+            # token change finishes after it
+            cache_key = (self._session.headers.get('Authorization'), url, tuple(sorted(query_args.items())))
+            cached = self._cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._debug('<<< (cached)')
+                # decode afresh, so callers never share a mutable result
+                return spess._json.loads(cached[1])
+
+        # encode the body ourselves, so we can use the faster encoder
+        data = None
+        headers = {}
+        if body is not None:
+            data = spess._json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+
+        r = self._send(method, url, query_args, data, headers)
 
         # 204 no content is an exception, to force dealing with it
         if r.status_code == 204:
@@ -227,7 +405,7 @@ class Backend:
             raise NoContentError(message='no content')
 
         try:
-            json = r.json()
+            json = spess._json.loads(r.content)
         except Exception:
             self._debug('<<<', r.status_code, repr(r.content))
             raise ParseError(message='response is not JSON')
@@ -235,22 +413,79 @@ class Backend:
         self._debug('<<<', r.status_code, json)
 
         if 200 <= r.status_code < 300:
+            if cache_key is not None:
+                now = time.monotonic()
+                # drop anything stale first, so the cache can't outgrow
+                # the set of paths polled within one ttl
+                for key, (expiry, _) in list(self._cache.items()):
+                    if expiry <= now:
+                        self._cache.pop(key, None)
+                self._cache[cache_key] = (now + self.config.cache_ttl, r.content)
             return json
 
-        # otherwise, an error
-        try:
-            msg = str(json['error']['message'])
-        except Exception:
-            msg = None
-        try:
-            code = int(json['error']['code'])
-        except Exception:
-            code = None
+        # otherwise, an error. pull out what we can without raising
+        msg = None
+        code = None
+        error = json.get('error') if type(json) is dict else None
+        if type(error) is dict:
+            if error.get('message') is not None:
+                msg = str(error['message'])
+            raw_code = error.get('code')
+            if type(raw_code) is int:
+                code = raw_code
+            elif type(raw_code) is str:
+                try:
+                    code = int(raw_code)
+                except ValueError:
+                    pass
 
         if 400 <= r.status_code < 500:
             raise ClientError(code, msg)
         raise ServerError(code, msg)
 
+    def _send(
+            self,
+            method: typing.Literal['get', 'post', 'patch'],
+            url: str,
+            query_args: dict[str, str | None],
+            data: bytes | None,
+            headers: dict[str, str],
+    ) -> requests.Response:
+        # already loaded by _make_session, so this is only a lookup
+        import requests
+
+        retry_status = self._retry_status if method == 'get' else self._retry_status_write
+        attempt = 0
+        while True:
+            if _limit_prepaid.get():
+                # call_async already waited for this one, on the event loop
+                _limit_prepaid.set(False)
+            else:
+                self._limit.limit()
+            try:
+                r = self._request(method, url, params=query_args, data=data, headers=headers)
+            except requests.ConnectionError:
+                # only a GET is surely safe to send twice
+                if method != 'get' or attempt + 1 >= self._retry_attempts:
+                    raise
+                retry_after = 0.0
+            else:
+                if r.status_code not in retry_status or attempt + 1 >= self._retry_attempts:
+                    return r
+                retry_after = _parse_retry_after(r.headers.get('Retry-After'))
+                if retry_after > self._retry_cap:
+                    # longer than we're willing to block for, so report
+                    # the error now instead
+                    return r
+
+            # full jitter, so clients that hit a limit together don't
+            # all come back together
+            delay = min(self._retry_cap, self._retry_base * 2 ** attempt)
+            delay = max(retry_after, delay) + random.uniform(0, self._retry_base)
+            self._debug('!!! retrying in', delay)
+            time.sleep(delay)
+            attempt += 1
+
     def _call[T: spess._json.FromJson](
             self,
             ty: type[T],
@@ -263,31 +498,68 @@ class Backend:
             sync: typing.Callable[[T], T] | None = None,
     ) -> T:
         # filter out Nones from values, which indicate absent optionals
-        path_args = {k: v for k, v in path_args.items() if v is not None}
-        query_args = {k: v for k, v in query_args.items() if v is not None}
+        path_args = _without_none(path_args)
+        query_args = _without_none(query_args)
         if isinstance(body, dict):
-            body = {k: v for k, v in body.items() if v is not None}
+            body = _without_none(body)
 
-        path = path.format(**path_args)
+        path = _compile_path(path)(path_args)
         json = self._call_json(method, path, query_args, body)
 
         # parse json
         if not adhoc:
-            try:
-                assert isinstance(json, dict)
-                json = json['data']
-            except Exception:
+            # explicit checks, not assert, so this still works under -O
+            if type(json) is not dict or 'data' not in json:
                 raise ParseError(message=f'response has no {"data"!r} key')
+            json = json['data']
+
+        # polling the same object often gets back the same payload. if
+        # none of the canonical object's fields have been assigned
+        # since, it already holds exactly this, so skip parsing and
+        # syncing it again
+        payload_key = None
+        if method == 'get' and sync and isinstance(ty, type) and issubclass(ty, bases.Synced):
+            payload_key = (ty, path, tuple(sorted(query_args.items())))
+            last = self._last_payload.get(payload_key)
+            if last is not None and last[1] == json:
+                existing = last[2]()
+                if existing is not None and getattr(existing, '_version', 0) == last[0]:
+                    return existing
+
         try:
-            data = spess._json.from_json(ty, json)
+            data = spess._json.parser_for(ty)(json)
         except Exception:
             raise ParseError(message=f'response is not {ty!r}')
 
+        # bind the client before syncing. when the sync finds an
+        # existing object, _update moves this object's fields (and their
+        # children) into it, and they need a client too
         self._set_client(data)
         if sync:
             data = sync(data)
+        if payload_key is not None:
+            self._remember_payload(payload_key, json, data)
         return data
 
+    def _remember_payload(self, key: tuple[type, str, tuple[tuple[str, str | None], ...]], json: spess._json.Json, data: typing.Any) -> None:
+        last_payload = self._last_payload
+
+        # once the object is gone, so is any use for its payload
+        def forget(ref: weakref.ref[typing.Any]) -> None:
+            entry = last_payload.get(key)
+            if entry is not None and entry[2] is ref:
+                last_payload.pop(key, None)
+
+        # re-insert, so the dict stays oldest first for trimming
+        last_payload.pop(key, None)
+        last_payload[key] = (getattr(data, '_version', 0), json, weakref.ref(data, forget))
+        while len(last_payload) > self._last_payload_max:
+            try:
+                del last_payload[next(iter(last_payload))]
+            except (KeyError, StopIteration, RuntimeError):
+                # another thread got there first
+                break
+
     def _call_paginated[T](
             self,
             ty: type[T],
@@ -299,38 +571,38 @@ class Backend:
             sync: typing.Callable[[T], T] | None = None,
     ) -> spess._paged.Paged[T]:
         # filter out Nones from values, which indicate absent optionals
-        path_args = {k: v for k, v in path_args.items() if v is not None}
-        query_args = {k: v for k, v in query_args.items() if v is not None}
+        path_args = _without_none(path_args)
+        query_args = _without_none(query_args)
         if isinstance(body, dict):
-            body = {k: v for k, v in body.items() if v is not None}
+            body = _without_none(body)
 
-        path = path.format(**path_args)
+        path = _compile_path(path)(path_args)
+        parse_data = spess._json.parser_for(list[ty]) # type: ignore
 
         def get_page(page: int = 1, limit: int = 10) -> tuple[spess.models.Meta, list[T]]:
-            page_query_args = query_args.copy()
-            page_query_args['page'] = str(page)
-            page_query_args['limit'] = str(limit)
+            # a fresh dict per page, so pages can be fetched concurrently
+            page_query_args = {**query_args, 'page': str(page), 'limit': str(limit)}
 
             json = self._call_json(method, path, page_query_args, body)
 
-            try:
-                assert isinstance(json, dict)
-                meta_j = json['meta']
-                data_j = json['data']
-            except Exception:
+            if type(json) is not dict or 'meta' not in json or 'data' not in json:
                 raise ParseError(message=f'paged response missing {"meta"!r} or {"data"!r} key')
+            meta_j = json['meta']
+            data_j = json['data']
 
             try:
                 meta = spess.models.Meta.from_json(meta_j)
             except Exception:
                 raise ParseError(message='paged response has bad meta')
             try:
-                data = spess._json.from_json(list[ty], data_j) # type: ignore
+                data = parse_data(data_j)
             except Exception:
                 raise ParseError(message=f'paged response data is not {ty!r}')
 
-            for x in data:
-                self._set_client(x)
+            # the list is homogeneous, so one check covers every item
+            if data and bases.needs_client(type(data[0])) and isinstance(self, spess.client.Client):
+                for x in data:
+                    bases.set_client(x, self)
 
             if sync:
                 return (meta, [sync(x) for x in data])
@@ -345,10 +617,9 @@ class Backend:
 
     def _resolve[T](self, ty: type[bases.Keyed[T]], key: str | T) -> str:
         if isinstance(key, str):
-            try:
-                return self._aliases[(ty, key)]
-            except KeyError:
-                pass
+            alias = self._aliases.get(ty, _NO_ALIASES).get(key)
+            if alias is not None:
+                return alias
         return ty._resolve(key)
 
     def _waypoint_to_system(self, waypoint: str | spess.models.WaypointLike) -> str:
@@ -379,27 +650,58 @@ class Backend:
            assert c.ship('hauler').symbol == 'NAME-2'
            assert c.ship('also-hauler').symbol == 'NAME-2'
         """
-        self._aliases[(ty, name)] = self._resolve(ty, value)
+        self._aliases.setdefault(ty, {})[name] = self._resolve(ty, value)
 
     def remove_alias(self, ty: type[bases.Keyed], name: str) -> str:
         """Removes an alias. See :func:`add_alias` for more info."""
-        return self._aliases.pop((ty, name))
+        names = self._aliases[ty]
+        value = names.pop(name)
+        if not names:
+            del self._aliases[ty]
+        return value
 
     @property
     def aliases(self) -> typing.Iterable[tuple[type[bases.Keyed], str, str]]:
         """Iterate over the defined aliases. See :func:`add_alias`
         for more info.
         """
-        for (ty, name), value in self._aliases.items():
-            yield ty, name, value
+        for ty, names in self._aliases.items():
+            for name, value in names.items():
+                yield ty, name, value
+
+    #
+    # Async
+    #
+
+    async def call_async[**P, T](self, f: typing.Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run a client method in a worker thread, so that many calls
+        can be awaited at once. Calls still obey the rate limit, but
+        their network round trips overlap. For example,
+
+        .. code-block::
+
+           ships = await asyncio.gather(
+               c.call_async(c.ship, 'NAME-1'),
+               c.call_async(c.ship, 'NAME-2'),
+           )
+        """
+        # wait out the rate limit here, without holding a thread. the
+        # context is copied into the worker, so only its first request
+        # skips the limiter
+        await self._limit.limit_async()
+        _limit_prepaid.set(True)
+        try:
+            return await asyncio.to_thread(f, *args, **kwargs)
+        finally:
+            _limit_prepaid.set(False)
 
     #
     # Model Manipulation
     #
 
     def _set_client[T](self, obj: T):
-        if isinstance(obj, bases.LocalClient) and isinstance(self, spess.client.Client):
-            obj._set_client(self)
+        if isinstance(self, spess.client.Client):
+            bases.set_client(obj, self)
 
     #
     # Sync Code
@@ -407,17 +709,27 @@ class Backend:
 
     def _sync[T: bases.Synced](self, obj: T) -> T:
         sync_key = (type(obj), getattr(obj, obj._class_key))
-        try:
-            existing = self._sync_table[sync_key]
-        except KeyError:
-            self._sync_table[sync_key] = obj
-        else:
-            obj = existing._update(obj) # type: ignore
+        # pages can be fetched (and synced) from several threads at once
+        with self._sync_lock:
+            existing = self._sync_table.setdefault(sync_key, obj)
+            if existing is not obj:
+                obj = existing._update(obj) # type: ignore
 
         return obj
 
     def _sync_list[T: bases.Synced](self, objs: list[T]) -> list[T]:
-        return [self._sync(x) for x in objs]
+        # same as _sync on each, but under one lock
+        keys = [(type(obj), getattr(obj, obj._class_key)) for obj in objs]
+        with self._sync_lock:
+            setdefault = self._sync_table.setdefault
+            results = []
+            for key, obj in zip(keys, objs):
+                existing = setdefault(key, obj)
+                if existing is not obj:
+                    obj = existing._update(obj) # type: ignore
+                results.append(obj)
+
+        return results
 
     def _sync_transfer_cargo(self, transfer: spess.responses.TransferCargo, from_ship: str, to_ship: str) -> None:
         self._sync_ship_cargo(transfer.cargo, from_ship)
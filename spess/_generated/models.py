@@ -4,11 +4,12 @@
 from __future__ import annotations
 
 import dataclasses
+import sys
 import typing
 
 import spess._backend as backend
 from spess._json import Json, from_json, to_json
-from spess._model_bases import date, datetime, Enum, LocalClient, Synced, Keyed
+from spess._model_bases import date, datetime, Enum, LocalClient, Waitable, Synced, Keyed
 from spess._paged import Paged
 import spess.responses as responses
 
@@ -37,7 +38,7 @@ __all__ = [
 ]
 
 # spec_name: Faction
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Faction:
     """Faction details."""
 
@@ -104,7 +105,7 @@ class FactionSymbol(Enum):
     VOID = 'VOID'
 
 # spec_name: FactionTrait
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FactionTraitInfo:
     __doc__ = ' '
 
@@ -198,7 +199,7 @@ class FactionTrait(Enum):
     WELCOMING = 'WELCOMING'
 
 # spec_name: Meta
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Meta:
     """Meta details for pagination."""
 
@@ -246,7 +247,7 @@ class AgentLike(typing.Protocol):
     def agent_symbol(self) -> str: ...
 
 # spec_name: PublicAgent
-@dataclasses.dataclass(eq=False)
+@dataclasses.dataclass(eq=False, slots=True)
 class PublicAgent(LocalClient, Keyed[AgentLike]):
     """Public agent details.
 
@@ -282,7 +283,7 @@ class PublicAgent(LocalClient, Keyed[AgentLike]):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             headquarters = from_json(str, v['headquarters']),
             credits = from_json(int, v['credits']),
             starting_faction = from_json(FactionSymbol, v['startingFaction']),
@@ -326,7 +327,7 @@ class SystemLike(typing.Protocol):
     def system_symbol(self) -> str: ...
 
 # spec_name: System
-@dataclasses.dataclass(eq=False)
+@dataclasses.dataclass(eq=False, slots=True)
 class System(LocalClient, Keyed[SystemLike]):
     """System details.
 
@@ -375,8 +376,8 @@ class System(LocalClient, Keyed[SystemLike]):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
-            sector_symbol = from_json(str, v['sectorSymbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
+            sector_symbol = sys.intern(from_json(str, v['sectorSymbol'])),
             type = from_json(SystemType, v['type']),
             x = from_json(int, v['x']),
             y = from_json(int, v['y']),
@@ -431,7 +432,7 @@ class SystemType(Enum):
     YOUNG_STAR = 'YOUNG_STAR'
 
 # spec_name: SystemWaypoint
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SystemWaypoint(LocalClient):
     """Waypoint details.
 
@@ -471,7 +472,7 @@ class SystemWaypoint(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             type = from_json(WaypointType, v['type']),
             x = from_json(int, v['x']),
             y = from_json(int, v['y']),
@@ -519,7 +520,7 @@ class WaypointType(Enum):
     PLANET = 'PLANET'
 
 # spec_name: WaypointOrbital
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class WaypointOrbital(LocalClient):
     """An orbital is another waypoint that orbits a parent
     waypoint.
@@ -541,7 +542,7 @@ class WaypointOrbital(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
         )
 
     @property
@@ -565,7 +566,7 @@ class WaypointOrbital(LocalClient):
         return self._c.waypoint(self.symbol)
 
 # spec_name: SystemFaction
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SystemFaction:
     __doc__ = ' '
 
@@ -620,7 +621,7 @@ class WaypointLike(typing.Protocol):
     def waypoint_symbol(self) -> str: ...
 
 # spec_name: Waypoint
-@dataclasses.dataclass(eq=False)
+@dataclasses.dataclass(eq=False, slots=True)
 class Waypoint(LocalClient, Keyed[WaypointLike]):
     """A waypoint is a location that ships can travel to such as
     a Planet, Moon or Space Station.
@@ -686,9 +687,9 @@ class Waypoint(LocalClient, Keyed[WaypointLike]):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             type = from_json(WaypointType, v['type']),
-            system_symbol = from_json(str, v['systemSymbol']),
+            system_symbol = sys.intern(from_json(str, v['systemSymbol'])),
             x = from_json(int, v['x']),
             y = from_json(int, v['y']),
             orbitals = from_json(list[WaypointOrbital], v['orbitals']),
@@ -786,7 +787,7 @@ class Waypoint(LocalClient, Keyed[WaypointLike]):
         return self._c.shipyard(self.symbol)
 
 # spec_name: WaypointFaction
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class WaypointFaction:
     """The faction that controls the waypoint."""
 
@@ -808,7 +809,7 @@ class WaypointFaction:
         )
 
 # spec_name: WaypointTrait
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class WaypointTraitInfo:
     __doc__ = ' '
 
@@ -912,7 +913,7 @@ class WaypointTrait(Enum):
     WEAK_GRAVITY = 'WEAK_GRAVITY'
 
 # spec_name: WaypointModifier
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class WaypointModifierInfo:
     __doc__ = ' '
 
@@ -952,7 +953,7 @@ class WaypointModifier(Enum):
     UNSTABLE = 'UNSTABLE'
 
 # spec_name: Chart
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Chart(LocalClient):
     """The chart of a system or waypoint, which makes the
     location visible to other agents.
@@ -980,7 +981,7 @@ class Chart(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            waypoint_symbol = from_json(str, v['waypointSymbol']),
+            waypoint_symbol = sys.intern(from_json(str, v['waypointSymbol'])),
             submitted_by = from_json(str, v['submittedBy']),
             submitted_on = from_json(datetime, v['submittedOn']),
         )
@@ -1000,7 +1001,7 @@ class Chart(LocalClient):
         return self._c.waypoint(self.waypoint_symbol)
 
 # spec_name: Construction
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Construction(LocalClient):
     """The construction details of a waypoint.
 
@@ -1027,7 +1028,7 @@ class Construction(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             materials = from_json(list[ConstructionMaterial], v['materials']),
             is_complete = from_json(bool, v['isComplete']),
         )
@@ -1053,7 +1054,7 @@ class Construction(LocalClient):
         return self._c.waypoint(self.symbol)
 
 # spec_name: ConstructionMaterial
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ConstructionMaterial:
     """The details of the required construction materials for a
     given waypoint under construction.
@@ -1235,7 +1236,7 @@ class TradeSymbol(Enum):
     VIRAL_AGENTS = 'VIRAL_AGENTS'
 
 # spec_name: ShipCargo
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipCargo:
     """Ship cargo details."""
 
@@ -1265,7 +1266,7 @@ class ShipCargo:
         )
 
 # spec_name: ShipCargoItem
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipCargoItem:
     """The type of cargo item and the number of units."""
 
@@ -1299,7 +1300,7 @@ class ShipCargoItem:
         )
 
 # spec_name: Market
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Market(LocalClient):
     """Market details.
 
@@ -1341,7 +1342,7 @@ class Market(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             exports = from_json(list[TradeGood], v['exports']),
             imports = from_json(list[TradeGood], v['imports']),
             exchange = from_json(list[TradeGood], v['exchange']),
@@ -1370,7 +1371,7 @@ class Market(LocalClient):
         return self._c.waypoint(self.symbol)
 
 # spec_name: TradeGood
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TradeGood:
     """A good that can be traded for other goods or currency."""
 
@@ -1400,7 +1401,7 @@ class TradeGood:
         )
 
 # spec_name: MarketTransaction
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MarketTransaction(LocalClient):
     """Result of a transaction with a market.
 
@@ -1450,9 +1451,9 @@ class MarketTransaction(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            waypoint_symbol = from_json(str, v['waypointSymbol']),
-            ship_symbol = from_json(str, v['shipSymbol']),
-            trade_symbol = from_json(str, v['tradeSymbol']),
+            waypoint_symbol = sys.intern(from_json(str, v['waypointSymbol'])),
+            ship_symbol = sys.intern(from_json(str, v['shipSymbol'])),
+            trade_symbol = sys.intern(from_json(str, v['tradeSymbol'])),
             type = from_json(MarketTransaction.Type, v['type']),
             units = from_json(int, v['units']),
             price_per_unit = from_json(int, v['pricePerUnit']),
@@ -1487,7 +1488,7 @@ class MarketTransaction(LocalClient):
         return self._c.waypoint(self.waypoint_symbol)
 
 # spec_name: MarketTradeGood
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MarketTradeGood:
     __doc__ = ' '
 
@@ -1576,7 +1577,7 @@ class ActivityLevel(Enum):
     WEAK = 'WEAK'
 
 # spec_name: JumpGate
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class JumpGate(LocalClient):
     """Details of a jump gate waypoint.
 
@@ -1600,7 +1601,7 @@ class JumpGate(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             connections = from_json(list[str], v['connections']),
         )
 
@@ -1625,7 +1626,7 @@ class JumpGate(LocalClient):
         return self._c.waypoint(self.symbol)
 
 # spec_name: Shipyard
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Shipyard(LocalClient):
     """Shipyard details.
 
@@ -1633,7 +1634,7 @@ class Shipyard(LocalClient):
     """
 
     # spec_name: Shipyard.shipTypes
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class ShipType:
         __doc__ = ' '
 
@@ -1687,7 +1688,7 @@ class Shipyard(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             ship_types = from_json(list[Shipyard.ShipType], v['shipTypes']),
             modifications_fee = from_json(int, v['modificationsFee']),
             transactions = from_json(list[ShipyardTransaction], v['transactions']) if 'transactions' in v else None,
@@ -1733,7 +1734,7 @@ class ShipType(Enum):
     SURVEYOR = 'SHIP_SURVEYOR'
 
 # spec_name: ShipyardTransaction
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipyardTransaction(LocalClient):
     """Results of a transaction with a shipyard.
 
@@ -1774,11 +1775,11 @@ class ShipyardTransaction(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            waypoint_symbol = from_json(str, v['waypointSymbol']),
-            ship_symbol = from_json(str, v['shipSymbol']),
+            waypoint_symbol = sys.intern(from_json(str, v['waypointSymbol'])),
+            ship_symbol = sys.intern(from_json(str, v['shipSymbol'])),
             ship_type = from_json(str, v['shipType']),
             price = from_json(int, v['price']),
-            agent_symbol = from_json(str, v['agentSymbol']),
+            agent_symbol = sys.intern(from_json(str, v['agentSymbol'])),
             timestamp = from_json(datetime, v['timestamp']),
         )
 
@@ -1809,12 +1810,12 @@ class ShipyardTransaction(LocalClient):
         return self._c.waypoint(self.waypoint_symbol)
 
 # spec_name: ShipyardShip
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipyardShip:
     """Ship details available at a shipyard."""
 
     # spec_name: ShipyardShip.crew
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Crew:
         __doc__ = ' '
 
@@ -1912,7 +1913,7 @@ class ShipyardShip:
         )
 
 # spec_name: ShipFrame
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipFrame:
     """The frame of the ship. The frame determines the number of
     modules and mounting points of the ship, as well as base fuel
@@ -2016,7 +2017,7 @@ class ShipFrame:
         )
 
 # spec_name: ShipRequirements
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipRequirements:
     """The requirements for installation on a ship"""
 
@@ -2049,7 +2050,7 @@ class ShipRequirements:
         )
 
 # spec_name: ShipReactor
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipReactor:
     """The reactor of the ship. The reactor is responsible for
     powering the ship's systems and weapons.
@@ -2127,7 +2128,7 @@ class ShipReactor:
         )
 
 # spec_name: ShipEngine
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipEngine:
     """The engine determines how quickly a ship travels between
     waypoints.
@@ -2204,7 +2205,7 @@ class ShipEngine:
         )
 
 # spec_name: ShipModule
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipModule:
     """A module can be installed in a ship and provides a set of
     capabilities such as storage space or quarters for crew. Module
@@ -2280,7 +2281,7 @@ class ShipModule:
         )
 
 # spec_name: ShipMount
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipMount:
     """A mount is installed on the exterier of a ship."""
 
@@ -2377,7 +2378,7 @@ class ContractLike(typing.Protocol):
     def contract_id(self) -> str: ...
 
 # spec_name: Contract
-@dataclasses.dataclass(eq=False)
+@dataclasses.dataclass(eq=False, slots=True)
 class Contract(LocalClient, Keyed[ContractLike]):
     """Contract details.
 
@@ -2491,7 +2492,7 @@ class Contract(LocalClient, Keyed[ContractLike]):
         return self._c.deliver_contract(self.id, ship, trade_symbol, units)
 
 # spec_name: ContractTerms
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ContractTerms:
     """The terms to fulfill the contract."""
 
@@ -2522,7 +2523,7 @@ class ContractTerms:
         )
 
 # spec_name: ContractPayment
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ContractPayment:
     """Payments for the contract."""
 
@@ -2549,7 +2550,7 @@ class ContractPayment:
         )
 
 # spec_name: ContractDeliverGood
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ContractDeliverGood(LocalClient):
     """The details of a delivery contract. Includes the type of
     good, units needed, and the destination.
@@ -2581,7 +2582,7 @@ class ContractDeliverGood(LocalClient):
             raise TypeError(type(v))
         return cls(
             trade_symbol = from_json(TradeSymbol, v['tradeSymbol']),
-            destination_symbol = from_json(str, v['destinationSymbol']),
+            destination_symbol = sys.intern(from_json(str, v['destinationSymbol'])),
             units_required = from_json(int, v['unitsRequired']),
             units_fulfilled = from_json(int, v['unitsFulfilled']),
         )
@@ -2607,7 +2608,7 @@ class ContractDeliverGood(LocalClient):
         return self._c.waypoint(self.destination_symbol)
 
 # spec_name: Agent
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Agent(LocalClient):
     """Agent details.
 
@@ -2646,7 +2647,7 @@ class Agent(LocalClient):
             raise TypeError(type(v))
         return cls(
             account_id = from_json(str, v['accountId']),
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             headquarters = from_json(str, v['headquarters']),
             credits = from_json(int, v['credits']),
             starting_faction = from_json(FactionSymbol, v['startingFaction']),
@@ -2676,7 +2677,7 @@ class Agent(LocalClient):
         return self._c.my_agent()
 
 # spec_name: AgentEvent
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AgentEvent:
     """Agent event details."""
 
@@ -2733,8 +2734,8 @@ class ShipLike(typing.Protocol):
     def ship_symbol(self) -> str: ...
 
 # spec_name: Ship
-@dataclasses.dataclass(eq=False)
-class Ship(LocalClient, Keyed[ShipLike]):
+@dataclasses.dataclass(eq=False, slots=True)
+class Ship(LocalClient, Waitable, Keyed[ShipLike]):
     """Ship details.
 
     This model is :class:`ShipLike<spess.models.ShipLike>`,
@@ -2800,7 +2801,7 @@ class Ship(LocalClient, Keyed[ShipLike]):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             registration = from_json(ShipRegistration, v['registration']),
             nav = from_json(ShipNav, v['nav']),
             crew = from_json(ShipCrew, v['crew']),
@@ -3306,16 +3307,16 @@ class Ship(LocalClient, Keyed[ShipLike]):
 
         return backend._wait(self.cooldown.expiration, self.nav.route.arrival, message=message)
 
-    def __await__(self) -> typing.Awaitable[None]:
+    def __await__(self) -> typing.Generator[typing.Any, None, None]:
         """Wait asynchronously until this object is ready for
         more actions. For an interactive, blocking wait, see
         :func:`wait`.
         """
 
-        return backend._await(self.cooldown.expiration, self.nav.route.arrival)
+        return backend._await(self.cooldown.expiration, self.nav.route.arrival, wake=self._waker())
 
 # spec_name: ShipRegistration
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipRegistration:
     """The public registration information of the ship"""
 
@@ -3364,8 +3365,8 @@ class ShipRole(Enum):
     TRANSPORT = 'TRANSPORT'
 
 # spec_name: ShipNav
-@dataclasses.dataclass
-class ShipNav(LocalClient):
+@dataclasses.dataclass(slots=True)
+class ShipNav(LocalClient, Waitable):
     """The navigation information of the ship.
 
     This model is :class:`SystemLike<spess.models.SystemLike>` and
@@ -3400,8 +3401,8 @@ class ShipNav(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            system_symbol = from_json(str, v['systemSymbol']),
-            waypoint_symbol = from_json(str, v['waypointSymbol']),
+            system_symbol = sys.intern(from_json(str, v['systemSymbol'])),
+            waypoint_symbol = sys.intern(from_json(str, v['waypointSymbol'])),
             route = from_json(ShipNavRoute, v['route']),
             status = from_json(ShipStatus, v['status']),
             flight_mode = from_json(FlightMode, v['flightMode']),
@@ -3441,17 +3442,17 @@ class ShipNav(LocalClient):
 
         return backend._wait(self.route.arrival, message=message)
 
-    def __await__(self) -> typing.Awaitable[None]:
+    def __await__(self) -> typing.Generator[typing.Any, None, None]:
         """Wait asynchronously until this object is ready for
         more actions. For an interactive, blocking wait, see
         :func:`wait`.
         """
 
-        return backend._await(self.route.arrival)
+        return backend._await(self.route.arrival, wake=self._waker())
 
 # spec_name: ShipNavRoute
-@dataclasses.dataclass
-class ShipNavRoute(LocalClient):
+@dataclasses.dataclass(slots=True)
+class ShipNavRoute(LocalClient, Waitable):
     """The routing information for the ship's most recent
     transit or current location.
     """
@@ -3498,16 +3499,16 @@ class ShipNavRoute(LocalClient):
 
         return backend._wait(self.arrival, message=message)
 
-    def __await__(self) -> typing.Awaitable[None]:
+    def __await__(self) -> typing.Generator[typing.Any, None, None]:
         """Wait asynchronously until this object is ready for
         more actions. For an interactive, blocking wait, see
         :func:`wait`.
         """
 
-        return backend._await(self.arrival)
+        return backend._await(self.arrival, wake=self._waker())
 
 # spec_name: ShipNavRouteWaypoint
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipNavRouteWaypoint(LocalClient):
     """The destination or departure of a ships nav route.
 
@@ -3541,9 +3542,9 @@ class ShipNavRouteWaypoint(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             type = from_json(WaypointType, v['type']),
-            system_symbol = from_json(str, v['systemSymbol']),
+            system_symbol = sys.intern(from_json(str, v['systemSymbol'])),
             x = from_json(int, v['x']),
             y = from_json(int, v['y']),
         )
@@ -3596,7 +3597,7 @@ class FlightMode(Enum):
     STEALTH = 'STEALTH'
 
 # spec_name: ShipCrew
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipCrew:
     """The ship's crew service and maintain the ship's systems
     and equipment.
@@ -3656,14 +3657,14 @@ class ShipCrew:
         )
 
 # spec_name: ShipFuel
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipFuel:
     """Details of the ship's fuel tanks including how much fuel
     was consumed during the last transit or action.
     """
 
     # spec_name: ShipFuel.consumed
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Consumed:
         """An object that only shows up when an action has
         consumed fuel in the process. Shows the fuel consumption data.
@@ -3719,8 +3720,8 @@ class ShipFuel:
         )
 
 # spec_name: Cooldown
-@dataclasses.dataclass
-class Cooldown(LocalClient):
+@dataclasses.dataclass(slots=True)
+class Cooldown(LocalClient, Waitable):
     """A cooldown is a period of time in which a ship cannot
     perform certain actions.
 
@@ -3751,7 +3752,7 @@ class Cooldown(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            ship_symbol = from_json(str, v['shipSymbol']),
+            ship_symbol = sys.intern(from_json(str, v['shipSymbol'])),
             total_seconds = from_json(int, v['totalSeconds']),
             remaining_seconds = from_json(int, v['remainingSeconds']),
             expiration = from_json(datetime, v['expiration']) if 'expiration' in v else None,
@@ -3781,16 +3782,16 @@ class Cooldown(LocalClient):
 
         return backend._wait(self.expiration, message=message)
 
-    def __await__(self) -> typing.Awaitable[None]:
+    def __await__(self) -> typing.Generator[typing.Any, None, None]:
         """Wait asynchronously until this object is ready for
         more actions. For an interactive, blocking wait, see
         :func:`wait`.
         """
 
-        return backend._await(self.expiration)
+        return backend._await(self.expiration, wake=self._waker())
 
 # spec_name: ChartTransaction
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ChartTransaction(LocalClient):
     """Result of a chart transaction.
 
@@ -3821,8 +3822,8 @@ class ChartTransaction(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            waypoint_symbol = from_json(str, v['waypointSymbol']),
-            ship_symbol = from_json(str, v['shipSymbol']),
+            waypoint_symbol = sys.intern(from_json(str, v['waypointSymbol'])),
+            ship_symbol = sys.intern(from_json(str, v['shipSymbol'])),
             total_price = from_json(int, v['totalPrice']),
             timestamp = from_json(datetime, v['timestamp']),
         )
@@ -3854,7 +3855,7 @@ class ChartTransaction(LocalClient):
         return self._c.waypoint(self.waypoint_symbol)
 
 # spec_name: Extraction
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Extraction(LocalClient):
     """Extraction details.
 
@@ -3878,7 +3879,7 @@ class Extraction(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            ship_symbol = from_json(str, v['shipSymbol']),
+            ship_symbol = sys.intern(from_json(str, v['shipSymbol'])),
             yield_ = from_json(ExtractionYield, v['yield']),
         )
 
@@ -3895,7 +3896,7 @@ class Extraction(LocalClient):
         return self._c.ship(self.ship_symbol)
 
 # spec_name: ExtractionYield
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ExtractionYield:
     """A yield from the extraction operation."""
 
@@ -3922,7 +3923,7 @@ class ExtractionYield:
         )
 
 # spec_name: ShipConditionEvent
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipConditionEvent:
     """An event that represents damage or wear to a ship's
     reactor, frame, or engine, reducing the condition of the ship.
@@ -3995,7 +3996,7 @@ class ShipConditionEvent:
         )
 
 # spec_name: Survey
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Survey(LocalClient):
     """A resource survey of a waypoint, detailing a specific
     extraction location and the types of resources that can be found
@@ -4038,7 +4039,7 @@ class Survey(LocalClient):
             raise TypeError(type(v))
         return cls(
             signature = from_json(str, v['signature']),
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             deposits = from_json(list[SurveyDeposit], v['deposits']),
             expiration = from_json(datetime, v['expiration']),
             size = from_json(SurveySize, v['size']),
@@ -4065,7 +4066,7 @@ class Survey(LocalClient):
         return self._c.waypoint(self.symbol)
 
 # spec_name: SurveyDeposit
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SurveyDeposit:
     """A surveyed deposit of a mineral or resource available for
     extraction.
@@ -4099,7 +4100,7 @@ class SurveySize(Enum):
     SMALL = 'SMALL'
 
 # spec_name: ScannedSystem
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ScannedSystem(LocalClient):
     """Details of a system was that scanned.
 
@@ -4135,8 +4136,8 @@ class ScannedSystem(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
-            sector_symbol = from_json(str, v['sectorSymbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
+            sector_symbol = sys.intern(from_json(str, v['sectorSymbol'])),
             type = from_json(SystemType, v['type']),
             x = from_json(int, v['x']),
             y = from_json(int, v['y']),
@@ -4162,7 +4163,7 @@ class ScannedSystem(LocalClient):
         return self._c.system(self.symbol)
 
 # spec_name: ScannedWaypoint
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ScannedWaypoint(LocalClient):
     """A waypoint that was scanned by a ship.
 
@@ -4211,9 +4212,9 @@ class ScannedWaypoint(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             type = from_json(WaypointType, v['type']),
-            system_symbol = from_json(str, v['systemSymbol']),
+            system_symbol = sys.intern(from_json(str, v['systemSymbol'])),
             x = from_json(int, v['x']),
             y = from_json(int, v['y']),
             orbitals = from_json(list[WaypointOrbital], v['orbitals']),
@@ -4251,7 +4252,7 @@ class ScannedWaypoint(LocalClient):
         return self._c.waypoint(self.symbol)
 
 # spec_name: ScannedShip
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ScannedShip(LocalClient):
     """The ship that was scanned. Details include information
     about the ship that could be detected by the scanner.
@@ -4260,7 +4261,7 @@ class ScannedShip(LocalClient):
     """
 
     # spec_name: ScannedShip.engine
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Engine:
         """The engine of the ship."""
 
@@ -4278,11 +4279,11 @@ class ScannedShip(LocalClient):
             if not isinstance(v, dict):
                 raise TypeError(type(v))
             return cls(
-                symbol = from_json(str, v['symbol']),
+                symbol = sys.intern(from_json(str, v['symbol'])),
             )
 
     # spec_name: ScannedShip.frame
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Frame:
         """The frame of the ship."""
 
@@ -4300,11 +4301,11 @@ class ScannedShip(LocalClient):
             if not isinstance(v, dict):
                 raise TypeError(type(v))
             return cls(
-                symbol = from_json(str, v['symbol']),
+                symbol = sys.intern(from_json(str, v['symbol'])),
             )
 
     # spec_name: ScannedShip.reactor
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Reactor:
         """The reactor of the ship."""
 
@@ -4322,11 +4323,11 @@ class ScannedShip(LocalClient):
             if not isinstance(v, dict):
                 raise TypeError(type(v))
             return cls(
-                symbol = from_json(str, v['symbol']),
+                symbol = sys.intern(from_json(str, v['symbol'])),
             )
 
     # spec_name: ScannedShip.mounts
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Mount:
         __doc__ = ' '
 
@@ -4344,7 +4345,7 @@ class ScannedShip(LocalClient):
             if not isinstance(v, dict):
                 raise TypeError(type(v))
             return cls(
-                symbol = from_json(str, v['symbol']),
+                symbol = sys.intern(from_json(str, v['symbol'])),
             )
 
     #: The globally unique identifier of the ship.
@@ -4382,7 +4383,7 @@ class ScannedShip(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            symbol = from_json(str, v['symbol']),
+            symbol = sys.intern(from_json(str, v['symbol'])),
             registration = from_json(ShipRegistration, v['registration']),
             nav = from_json(ShipNav, v['nav']),
             engine = from_json(ScannedShip.Engine, v['engine']),
@@ -4410,7 +4411,7 @@ class ScannedShip(LocalClient):
         return self._c.ship(self.symbol)
 
 # spec_name: ScrapTransaction
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ScrapTransaction(LocalClient):
     """Result of a scrap transaction.
 
@@ -4441,8 +4442,8 @@ class ScrapTransaction(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            waypoint_symbol = from_json(str, v['waypointSymbol']),
-            ship_symbol = from_json(str, v['shipSymbol']),
+            waypoint_symbol = sys.intern(from_json(str, v['waypointSymbol'])),
+            ship_symbol = sys.intern(from_json(str, v['shipSymbol'])),
             total_price = from_json(int, v['totalPrice']),
             timestamp = from_json(datetime, v['timestamp']),
         )
@@ -4474,7 +4475,7 @@ class ScrapTransaction(LocalClient):
         return self._c.waypoint(self.waypoint_symbol)
 
 # spec_name: RepairTransaction
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RepairTransaction(LocalClient):
     """Result of a repair transaction.
 
@@ -4505,8 +4506,8 @@ class RepairTransaction(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            waypoint_symbol = from_json(str, v['waypointSymbol']),
-            ship_symbol = from_json(str, v['shipSymbol']),
+            waypoint_symbol = sys.intern(from_json(str, v['waypointSymbol'])),
+            ship_symbol = sys.intern(from_json(str, v['shipSymbol'])),
             total_price = from_json(int, v['totalPrice']),
             timestamp = from_json(datetime, v['timestamp']),
         )
@@ -4538,7 +4539,7 @@ class RepairTransaction(LocalClient):
         return self._c.waypoint(self.waypoint_symbol)
 
 # spec_name: Siphon
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Siphon(LocalClient):
     """Siphon details.
 
@@ -4562,7 +4563,7 @@ class Siphon(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            ship_symbol = from_json(str, v['shipSymbol']),
+            ship_symbol = sys.intern(from_json(str, v['shipSymbol'])),
             yield_ = from_json(SiphonYield, v['yield']),
         )
 
@@ -4579,7 +4580,7 @@ class Siphon(LocalClient):
         return self._c.ship(self.ship_symbol)
 
 # spec_name: SiphonYield
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SiphonYield:
     """A yield from the siphon operation."""
 
@@ -4606,7 +4607,7 @@ class SiphonYield:
         )
 
 # spec_name: ShipModificationTransaction
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipModificationTransaction(LocalClient):
     """Result of a transaction for a ship modification, such as
     installing a mount or a module.
@@ -4641,8 +4642,8 @@ class ShipModificationTransaction(LocalClient):
         if not isinstance(v, dict):
             raise TypeError(type(v))
         return cls(
-            waypoint_symbol = from_json(str, v['waypointSymbol']),
-            ship_symbol = from_json(str, v['shipSymbol']),
+            waypoint_symbol = sys.intern(from_json(str, v['waypointSymbol'])),
+            ship_symbol = sys.intern(from_json(str, v['shipSymbol'])),
             trade_symbol = from_json(TradeSymbol, v['tradeSymbol']),
             total_price = from_json(int, v['totalPrice']),
             timestamp = from_json(datetime, v['timestamp']),
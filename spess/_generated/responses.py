@@ -4,12 +4,13 @@
 from __future__ import annotations
 
 import dataclasses
+import sys
 import typing
 
 import spess._backend as backend
 from spess._json import Json, from_json, to_json
 import spess.models as models
-from spess._model_bases import date, datetime, Enum, LocalClient, Synced, Keyed
+from spess._model_bases import date, datetime, Enum, LocalClient, Waitable, Synced, Keyed
 from spess._paged import Paged
 
 __all__ = [
@@ -27,12 +28,12 @@ __all__ = [
 ]
 
 # spec_name: get-status.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ServerStatus:
     """Fetched status successfully."""
 
     # spec_name: get-status.response.stats
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Stats:
         __doc__ = ' '
 
@@ -71,7 +72,7 @@ class ServerStatus:
             )
 
     # spec_name: get-status.response.health
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Health:
         __doc__ = ' '
 
@@ -94,12 +95,12 @@ class ServerStatus:
             )
 
     # spec_name: get-status.response.leaderboards
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Leaderboards:
         __doc__ = ' '
 
         # spec_name: get-status.response.leaderboards.mostCredits
-        @dataclasses.dataclass
+        @dataclasses.dataclass(slots=True)
         class MostCredit:
             __doc__ = ' '
 
@@ -126,12 +127,12 @@ class ServerStatus:
                 if not isinstance(v, dict):
                     raise TypeError(type(v))
                 return cls(
-                    agent_symbol = from_json(str, v['agentSymbol']),
+                    agent_symbol = sys.intern(from_json(str, v['agentSymbol'])),
                     credits = from_json(int, v['credits']),
                 )
 
         # spec_name: get-status.response.leaderboards.mostSubmittedCharts
-        @dataclasses.dataclass
+        @dataclasses.dataclass(slots=True)
         class MostSubmittedChart:
             __doc__ = ' '
 
@@ -158,7 +159,7 @@ class ServerStatus:
                 if not isinstance(v, dict):
                     raise TypeError(type(v))
                 return cls(
-                    agent_symbol = from_json(str, v['agentSymbol']),
+                    agent_symbol = sys.intern(from_json(str, v['agentSymbol'])),
                     chart_count = from_json(int, v['chartCount']),
                 )
 
@@ -184,7 +185,7 @@ class ServerStatus:
             )
 
     # spec_name: get-status.response.serverResets
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class ServerResets:
         __doc__ = ' '
 
@@ -210,7 +211,7 @@ class ServerStatus:
             )
 
     # spec_name: get-status.response.announcements
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Announcement:
         __doc__ = ' '
 
@@ -234,7 +235,7 @@ class ServerStatus:
             )
 
     # spec_name: get-status.response.links
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Link:
         __doc__ = ' '
 
@@ -304,12 +305,12 @@ class ServerStatus:
         )
 
 # spec_name: get-error-codes.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ErrorCodes:
     """Fetched error codes successfully."""
 
     # spec_name: get-error-codes.response.errorCodes
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class ErrorCode:
         __doc__ = ' '
 
@@ -349,7 +350,7 @@ class ErrorCodes:
         )
 
 # spec_name: supply-construction.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SupplyConstruction:
     """Successfully supplied construction site."""
 
@@ -375,7 +376,7 @@ class SupplyConstruction:
         )
 
 # spec_name: accept-contract.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AcceptContract:
     """Successfully accepted contract."""
 
@@ -401,7 +402,7 @@ class AcceptContract:
         )
 
 # spec_name: fulfill-contract.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FulfillContract:
     """Successfully fulfilled a contract."""
 
@@ -427,7 +428,7 @@ class FulfillContract:
         )
 
 # spec_name: deliver-contract.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DeliverContract:
     """Successfully delivered cargo to contract."""
 
@@ -453,7 +454,7 @@ class DeliverContract:
         )
 
 # spec_name: get-my-factions.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MyFaction:
     __doc__ = ' '
 
@@ -477,7 +478,7 @@ class MyFaction:
         )
 
 # spec_name: purchase-ship.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PurchaseShip:
     """Purchased ship successfully."""
 
@@ -507,12 +508,12 @@ class PurchaseShip:
         )
 
 # spec_name: get-my-account.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MyAccount:
     """Default Response"""
 
     # spec_name: get-my-account.response.account
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Account:
         __doc__ = ' '
 
@@ -559,7 +560,7 @@ class MyAccount:
         )
 
 # spec_name: create-chart.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateChart:
     """Successfully charted waypoint."""
 
@@ -595,7 +596,7 @@ class CreateChart:
         )
 
 # spec_name: negotiate-contract.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NegotiateContract:
     """Successfully negotiated a new contract."""
 
@@ -617,7 +618,7 @@ class NegotiateContract:
         )
 
 # spec_name: dock-ship.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DockShip:
     """The ship has successfully docked at its current location."""
 
@@ -639,7 +640,7 @@ class DockShip:
         )
 
 # spec_name: extract-resources.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ExtractResources:
     """Successfully extracted resources."""
 
@@ -677,7 +678,7 @@ class ExtractResources:
         )
 
 # spec_name: extract-resources-with-survey.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ExtractResourcesWithSurvey:
     """Successfully extracted resources."""
 
@@ -715,7 +716,7 @@ class ExtractResourcesWithSurvey:
         )
 
 # spec_name: jettison.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Jettison:
     """Jettison successful."""
 
@@ -737,7 +738,7 @@ class Jettison:
         )
 
 # spec_name: jump-ship.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class JumpShip:
     """Jump successful."""
 
@@ -772,7 +773,7 @@ class JumpShip:
         )
 
 # spec_name: create-ship-system-scan.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateShipSystemScan:
     """Successfully scanned for nearby systems."""
 
@@ -799,7 +800,7 @@ class CreateShipSystemScan:
         )
 
 # spec_name: create-ship-waypoint-scan.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateShipWaypointScan:
     """Successfully scanned for nearby waypoints."""
 
@@ -826,7 +827,7 @@ class CreateShipWaypointScan:
         )
 
 # spec_name: create-ship-ship-scan.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateShipShipScan:
     """Successfully scanned for nearby ships."""
 
@@ -853,7 +854,7 @@ class CreateShipShipScan:
         )
 
 # spec_name: scrap-ship.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ScrapShip:
     """Ship scrapped successfully."""
 
@@ -879,7 +880,7 @@ class ScrapShip:
         )
 
 # spec_name: get-scrap-ship.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GetScrapShip:
     """Successfully retrieved the amount of value that will be
     returned when scrapping a ship.
@@ -903,7 +904,7 @@ class GetScrapShip:
         )
 
 # spec_name: navigate-ship.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NavigateShip:
     """The successful transit information including the route
     details and changes to ship fuel. The route includes the expected
@@ -936,7 +937,7 @@ class NavigateShip:
         )
 
 # spec_name: warp-ship.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class WarpShip:
     """The successful transit information including the route
     details and changes to ship fuel. The route includes the expected
@@ -969,7 +970,7 @@ class WarpShip:
         )
 
 # spec_name: orbit-ship.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OrbitShip:
     """The ship has successfully moved into orbit at its current
     location.
@@ -993,7 +994,7 @@ class OrbitShip:
         )
 
 # spec_name: purchase-cargo.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PurchaseCargo:
     """Purchased goods successfully."""
 
@@ -1023,12 +1024,12 @@ class PurchaseCargo:
         )
 
 # spec_name: ship-refine.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ShipRefine:
     """The ship has successfully refined goods."""
 
     # spec_name: ship-refine.response.produced
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class ProducedItem:
         __doc__ = ' '
 
@@ -1054,7 +1055,7 @@ class ShipRefine:
             )
 
     # spec_name: ship-refine.response.consumed
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class ConsumedItem:
         __doc__ = ' '
 
@@ -1110,7 +1111,7 @@ class ShipRefine:
         )
 
 # spec_name: refuel-ship.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RefuelShip:
     """Refueled successfully."""
 
@@ -1146,7 +1147,7 @@ class RefuelShip:
         )
 
 # spec_name: repair-ship.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RepairShip:
     """Ship repaired successfully."""
 
@@ -1176,7 +1177,7 @@ class RepairShip:
         )
 
 # spec_name: get-repair-ship.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GetRepairShip:
     """Successfully retrieved the cost of repairing a ship."""
 
@@ -1198,7 +1199,7 @@ class GetRepairShip:
         )
 
 # spec_name: sell-cargo.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SellCargo:
     """Cargo was successfully sold."""
 
@@ -1228,7 +1229,7 @@ class SellCargo:
         )
 
 # spec_name: siphon-resources.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SiphonResources:
     """Siphon successful."""
 
@@ -1262,7 +1263,7 @@ class SiphonResources:
         )
 
 # spec_name: create-survey.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateSurvey:
     """Surveys has been created."""
 
@@ -1289,7 +1290,7 @@ class CreateSurvey:
         )
 
 # spec_name: transfer-cargo.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TransferCargo:
     """Cargo transferred successfully."""
 
@@ -1315,7 +1316,7 @@ class TransferCargo:
         )
 
 # spec_name: install-ship-module.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class InstallShipModule:
     """Successfully installed the module on the ship."""
 
@@ -1349,7 +1350,7 @@ class InstallShipModule:
         )
 
 # spec_name: remove-ship-module.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RemoveShipModule:
     """Successfully removed the module from the ship."""
 
@@ -1383,7 +1384,7 @@ class RemoveShipModule:
         )
 
 # spec_name: install-mount.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class InstallMount:
     """Successfully installed the mount."""
 
@@ -1419,7 +1420,7 @@ class InstallMount:
         )
 
 # spec_name: remove-mount.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RemoveMount:
     """Successfully removed the mount."""
 
@@ -1455,7 +1456,7 @@ class RemoveMount:
         )
 
 # spec_name: patch-ship-nav.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PatchShipNav:
     """Success response for updating the nav configuration of a
     ship.
@@ -1487,7 +1488,7 @@ class PatchShipNav:
         )
 
 # spec_name: register.response
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Register:
     """Successfully registered."""
 
@@ -17,16 +17,55 @@ class JsonFormat(typing.Protocol):
     def from_json(cls, v: Json) -> typing.Self:
         raise NotImplementedError
 
+# wire format, using orjson if it's available
+try:
+    import orjson # type: ignore
+except ImportError:
+    import json
+
+    def dumps(v: Json) -> bytes:
+        return json.dumps(v, separators=(',', ':')).encode()
+
+    def loads(b: bytes) -> typing.Any:
+        return json.loads(b)
+else:
+    def dumps(v: Json) -> bytes:
+        return orjson.dumps(v)
+
+    def loads(b: bytes) -> typing.Any:
+        return orjson.loads(b)
+
 ToJson: typing.TypeAlias = JsonFormat | dt.datetime | dt.date | JsonLayer['ToJson']
 
+_PRIMITIVES = frozenset({bool, float, int, str, types.NoneType})
+
+# the to_json method of each JsonFormat type, or None for other types.
+# a runtime protocol check inspects attributes each time, so do it
+# once per type
+_to_json_method: dict[type, typing.Callable[[typing.Any], Json] | None] = {}
+
 def to_json(v: ToJson) -> Json:
-    if isinstance(v, JsonFormat):
-        return v.to_json()
+    # most values are leaves, so check those (and containers) by exact
+    # type before anything more expensive
+    t = type(v)
+    if t in _PRIMITIVES:
+        return typing.cast(Json, v)
+    elif t is list:
+        return [to_json(val) for val in typing.cast(list[ToJson], v)]
+    elif t is dict:
+        return {str(k): to_json(val) for k, val in typing.cast(dict[str, ToJson], v).items()}
+
+    try:
+        method = _to_json_method[t]
+    except KeyError:
+        method = _to_json_method[t] = type(v).to_json if isinstance(v, JsonFormat) else None
+
+    if method is not None:
+        return method(v)
     elif isinstance(v, dt.datetime):
-        s = v.astimezone(dt.UTC).isoformat()
-        if s.endswith('+00:00'):
-            s = s[:-len('+00:00')] + 'Z'
-        return s
+        # formatting naive UTC and adding the Z is quicker than
+        # formatting the offset and then rewriting it
+        return v.astimezone(dt.UTC).replace(tzinfo=None).isoformat() + 'Z'
     elif isinstance(v, dt.date):
         return v.isoformat()
     elif isinstance(v, dict):
@@ -41,6 +80,27 @@ def to_json(v: ToJson) -> Json:
 FromJson: typing.TypeAlias = JsonFormat | dt.datetime | dt.date | JsonLayer['FromJson']
 
 def from_json[T: FromJson](cls: type[T], v: Json) -> T:
+    # this runs for every field of every model, so look in the parser
+    # table directly, and only fall back to compiling on a miss
+    try:
+        parser = _parsers[cls]
+    except KeyError:
+        parser = parser_for(cls)
+    return parser(v)
+
+_parsers: dict[typing.Any, typing.Callable[[Json], typing.Any]] = {}
+
+def parser_for[T: FromJson](cls: type[T]) -> typing.Callable[[Json], T]:
+    """Like compile_parser, but only compiles each type once."""
+    try:
+        return _parsers[cls]
+    except KeyError:
+        parser = _parsers[cls] = compile_parser(cls)
+        return parser
+
+def compile_parser[T: FromJson](cls: type[T]) -> typing.Callable[[Json], T]:
+    """Build a function that parses json into `cls`. All the type
+    dispatch happens here, once, rather than on every value."""
     args = typing.get_args(cls)
     origin = typing.get_origin(cls)
     if origin is not None:
@@ -49,52 +109,81 @@ def from_json[T: FromJson](cls: type[T], v: Json) -> T:
     # lots of casts to help checker know that cls(...) has type T
 
     if issubclass(cls, JsonFormat):
-        return typing.cast(T, cls.from_json(v))
+        return typing.cast(typing.Callable[[Json], T], cls.from_json)
     elif issubclass(cls, dt.datetime):
-        if isinstance(v, str):
-            return typing.cast(T, cls.fromisoformat(v).astimezone())
-        else:
-            raise TypeError('expected str')
+        def parse_datetime(v: Json) -> T:
+            if isinstance(v, str):
+                return typing.cast(T, cls.fromisoformat(v).astimezone())
+            else:
+                raise TypeError('expected str')
+        return parse_datetime
     elif issubclass(cls, dt.date):
-        if isinstance(v, str):
-            return typing.cast(T, cls.fromisoformat(v))
-        else:
-            raise TypeError('expected str')
+        def parse_date(v: Json) -> T:
+            if isinstance(v, str):
+                return typing.cast(T, cls.fromisoformat(v))
+            else:
+                raise TypeError('expected str')
+        return parse_date
     elif issubclass(cls, dict) and len(args) == 2 and issubclass(args[0], str):
-        if isinstance(v, dict):
-            return typing.cast(T, cls({k: from_json(args[1], val) for k, val in v.items()}))
-        else:
-            raise TypeError('expected dict')
+        parse_value = parser_for(args[1])
+        def parse_dict(v: Json) -> T:
+            if isinstance(v, dict):
+                return typing.cast(T, cls({k: parse_value(val) for k, val in v.items()}))
+            else:
+                raise TypeError('expected dict')
+        return parse_dict
     elif issubclass(cls, list) and len(args) == 1:
-        if isinstance(v, list):
-            return typing.cast(T, cls([from_json(args[0], val) for val in v]))
-        else:
-            raise TypeError('expected list')
+        parse_item = parser_for(args[0])
+        def parse_list(v: Json) -> T:
+            if isinstance(v, list):
+                return typing.cast(T, cls([parse_item(val) for val in v]))
+            else:
+                raise TypeError('expected list')
+        return parse_list
+    # bool before int, since bool is a subclass of int. which one is
+    # tested first only matters here, once per type; the parsers
+    # themselves return exact matches without converting them
     elif issubclass(cls, bool):
-        if isinstance(v, bool):
-            return typing.cast(T, cls(v))
-        else:
-            raise TypeError('expected bool')
+        def parse_bool(v: Json) -> T:
+            if isinstance(v, bool):
+                return typing.cast(T, cls(v))
+            else:
+                raise TypeError('expected bool')
+        return parse_bool
     elif issubclass(cls, float):
-        if isinstance(v, (int, float)):
-            return typing.cast(T, cls(v))
-        else:
-            raise TypeError('expected float')
+        def parse_float(v: Json) -> T:
+            if type(v) is cls:
+                return typing.cast(T, v)
+            elif isinstance(v, (int, float)):
+                return typing.cast(T, cls(v))
+            else:
+                raise TypeError('expected float')
+        return parse_float
     elif issubclass(cls, int):
-        if isinstance(v, int):
-            return typing.cast(T, cls(v))
-        else:
-            raise TypeError('expected int')
+        def parse_int(v: Json) -> T:
+            if type(v) is cls:
+                return typing.cast(T, v)
+            elif isinstance(v, int):
+                return typing.cast(T, cls(v))
+            else:
+                raise TypeError('expected int')
+        return parse_int
     elif issubclass(cls, str):
-        if isinstance(v, str):
-            return typing.cast(T, cls(v))
-        else:
-            raise TypeError('expected str')
+        def parse_str(v: Json) -> T:
+            if type(v) is cls:
+                return typing.cast(T, v)
+            elif isinstance(v, str):
+                return typing.cast(T, cls(v))
+            else:
+                raise TypeError('expected str')
+        return parse_str
     elif cls == types.NoneType:
         # NoneType can't be subclassed
-        if v == None:
-            return typing.cast(T, None)
-        else:
-            raise TypeError('expected None')
+        def parse_none(v: Json) -> T:
+            if v == None:
+                return typing.cast(T, None)
+            else:
+                raise TypeError('expected None')
+        return parse_none
     else:
         raise TypeError(cls)
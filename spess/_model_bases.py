@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import datetime as dt
 import enum
 import functools
+import types
 import typing
 
 import spess.client
@@ -11,11 +13,15 @@ from spess._json import Json
 
 # for custom repr
 class date(dt.date):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return f'<{self:%Y-%m-%d}>'
 
 # for custom repr
 class datetime(dt.datetime):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return f'<{self:%Y-%m-%d %H:%M:%S UTC%:z}>'
 
@@ -36,16 +42,91 @@ class Enum(enum.Enum):
             raise TypeError(type(v))
         return cls(v)
 
-class LocalClient:
+# field names of a dataclass, or None if it isn't one. computed on
+# first use, since __init_subclass__ runs before @dataclass does
+_field_names_cache: dict[type, tuple[str, ...] | None] = {}
+
+def _field_names(cls: type) -> tuple[str, ...] | None:
+    try:
+        return _field_names_cache[cls]
+    except KeyError:
+        names = None
+        if dataclasses.is_dataclass(cls):
+            names = tuple(field.name for field in dataclasses.fields(cls))
+        _field_names_cache[cls] = names
+        return names
+
+# names of the fields of a dataclass that can hold something needing
+# a client, directly or inside a list. worked out once per class from
+# the type hints, so binding a client only looks where it has to
+_client_children_cache: dict[type, tuple[str, ...]] = {}
+
+def _client_children(cls: type) -> tuple[str, ...]:
+    try:
+        return _client_children_cache[cls]
+    except KeyError:
+        pass
+
+    # stand-in while this is worked out, in case a type contains itself
+    _client_children_cache[cls] = ()
+    names = _field_names(cls) or ()
+    try:
+        hints = typing.get_type_hints(cls)
+    except Exception:
+        # can't tell, so check every field at runtime
+        children = names
+    else:
+        children = tuple(n for n in names if any(needs_client(t) for t in _leaf_types(hints[n])))
+    _client_children_cache[cls] = children
+    return children
+
+def _leaf_types(hint: typing.Any) -> typing.Iterator[typing.Any]:
+    origin = typing.get_origin(hint)
+    if origin is types.UnionType or origin is typing.Union:
+        for arg in typing.get_args(hint):
+            yield from _leaf_types(arg)
+    elif origin is list:
+        yield from _leaf_types(typing.get_args(hint)[0])
+    else:
+        yield hint
+
+def needs_client(cls: typing.Any) -> bool:
+    """Does a value of this type need a client set on it?"""
+    if not isinstance(cls, type):
+        return False
+    return issubclass(cls, LocalClient) or bool(_client_children(cls))
+
+def set_client(obj: typing.Any, client: spess.client.Client) -> None:
+    """Set the client on this object and everything inside it that
+    needs one."""
+    if isinstance(obj, LocalClient):
+        obj._set_client(client)
+    else:
+        _set_children_client(obj, client)
+
+def _set_children_client(obj: typing.Any, client: spess.client.Client) -> None:
+    for name in _client_children(type(obj)):
+        child = getattr(obj, name, None)
+        if isinstance(child, list):
+            for item in child:
+                set_client(item, client)
+        elif child is not None:
+            set_client(child, client)
+
+# models are slotted, and a class can only inherit slots from one
+# base, so every slot any mixin needs lives here. __weakref__ is for
+# the backend's sync table
+class _Base:
+    __slots__ = ('_client', '_wake', '_version', '__weakref__')
+
+class LocalClient(_Base):
+    __slots__ = ()
+
     _client: spess.client.Client | None
 
     def _set_client(self, client: spess.client.Client):
         self._client = client
-        if dataclasses.is_dataclass(self):
-            for field in dataclasses.fields(self):
-                child = getattr(self, field.name, None)
-                if isinstance(child, LocalClient):
-                    child._set_client(client)
+        _set_children_client(self, client)
 
     @property
     def _c(self) -> spess.client.Client:
@@ -53,18 +134,53 @@ class LocalClient:
             raise RuntimeError('model has no reference to client')
         return self._client
 
-class Synced:
+class Waitable(_Base):
+    __slots__ = ()
+
+    _wake: set[asyncio.Event] | None
+
+    def _waker(self) -> set[asyncio.Event]:
+        # each await adds its own event here for as long as it waits.
+        # an event belongs to the loop that first waits on it, and models
+        # outlive loops, so the events themselves are never kept around
+        wake = getattr(self, '_wake', None)
+        if wake is None:
+            wake = self._wake = set()
+        return wake
+
+    def cancel_wait(self) -> None:
+        """Wake up anything currently awaiting this object, right away.
+        This must be called from the same thread as the awaits.
+        """
+        for event in list(getattr(self, '_wake', None) or ()):
+            event.set()
+
+class Synced(_Base):
+    __slots__ = ()
+
     _class_key: typing.ClassVar[str]
+    _version: int
+
+    # count assignments to fields, whether from a sync or by hand, so
+    # the backend can tell if this still holds a payload it remembers.
+    # changes made inside a field's value are not counted
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        super().__setattr__(name, value)
+        if name[0] != '_':
+            object.__setattr__(self, '_version', getattr(self, '_version', 0) + 1)
 
     def _update(self, other: typing.Self) -> typing.Self:
-        if dataclasses.is_dataclass(other):
-            for field in dataclasses.fields(other):
-                setattr(self, field.name, getattr(other, field.name))
+        names = _field_names(type(other))
+        if names is not None:
+            for name in names:
+                setattr(self, name, getattr(other, name))
             return self
         return other
 
 @functools.total_ordering
 class Keyed[SelfKey](Synced):
+    __slots__ = ()
+
     @classmethod
     def _resolve(cls, other: str | SelfKey) -> str:
         if isinstance(other, str):
@@ -90,7 +206,13 @@ class Keyed[SelfKey](Synced):
         except AttributeError:
             return None
 
+    # same-type comparisons are by far the most common, so they skip
+    # the general _compare_keys path
+
     def __eq__(self, other: object) -> bool:
+        if type(other) is type(self):
+            key = self._class_key
+            return getattr(self, key) == getattr(other, key)
         keys = self._compare_keys(other)
         if keys is None:
             return NotImplemented
@@ -98,8 +220,15 @@ class Keyed[SelfKey](Synced):
             return keys[0] == keys[1]
 
     def __lt__(self, other: object) -> bool:
+        if type(other) is type(self):
+            key = self._class_key
+            return getattr(self, key) < getattr(other, key)
         keys = self._compare_keys(other)
         if keys is None:
             return NotImplemented
         else:
             return keys[0] < keys[1]
+
+    # keyed objects compare equal to their key string, so hash the same
+    def __hash__(self) -> int:
+        return hash(getattr(self, self._class_key))
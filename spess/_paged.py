@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import concurrent.futures
 import typing
 
 import spess.models
@@ -10,8 +11,10 @@ class GetPage[T](typing.Protocol):
     def __call__(self, page: int = 1, limit: int = 10) -> tuple[spess.models.Meta, list[T]]: ...
 
 class Paged[T]:
-    def __init__(self, get_page: GetPage[T]) -> None:
+    def __init__(self, get_page: GetPage[T], prefetch: int = 1) -> None:
         self._get_page = get_page
+        # how many pages to fetch ahead of the caller while iterating
+        self.prefetch = prefetch
 
         self.bound_low = 0
         self.bound_high: int | None = None
@@ -20,7 +23,8 @@ class Paged[T]:
         self.firstpage = None
 
     def first(self) -> T:
-        for v in self:
+        # only ever needs one page, so don't fetch ahead
+        for v in self._iter(prefetch=0):
             return v
         raise ValueError('no items')
 
@@ -29,19 +33,80 @@ class Paged[T]:
         return self
 
     def all(self) -> list[T]:
-        return list(self)
+        # the first page says how many items there are, so fetch the
+        # rest of the pages all at once rather than one after another
+        page = self.bound_low // self.pagesize
+        meta, data = self._get_page(page=page + 1, limit=self.pagesize)
+        end = meta.total
+        if self.bound_high is not None:
+            end = min(end, self.bound_high)
+        last_page = max(page, (end - 1) // self.pagesize)
 
-    def __iter__(self) -> typing.Iterator[T]:
-        i = self.bound_low
-        while self.bound_high is None or i < self.bound_high:
-            page = (i // self.pagesize)
-            pageoffset = i - page * self.pagesize
-            if self.bound_high is not None:
-                pagemax = self.bound_high - page * self.pagesize
-            else:
-                pagemax = self.pagesize
-            _, data = self._get_page(page=page + 1, limit=self.pagesize)
-            yield from data[pageoffset:pagemax]
-            i += min(len(data), pagemax) - pageoffset
+        pages = [data]
+        if last_page > page:
+            # the rate limiter decides when these really go out
+            workers = min(last_page - page, 8)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._get_page, page=p + 1, limit=self.pagesize) for p in range(page + 1, last_page + 1)]
+                pages.extend(f.result()[1] for f in futures)
+
+        # a short page means the end, just like iterating
+        items: list[T] = []
+        for data in pages:
+            items.extend(data)
             if len(data) < self.pagesize:
                 break
+        start = page * self.pagesize
+        items = items[self.bound_low - start:]
+        if self.bound_high is not None:
+            items = items[:self.bound_high - self.bound_low]
+
+        # the total may have grown since the first page. if so, pick up
+        # the rest the slow way
+        next_i = (last_page + 1) * self.pagesize
+        if len(data) == self.pagesize and (self.bound_high is None or next_i < self.bound_high):
+            items.extend(self._iter(prefetch=self.prefetch, start=next_i))
+        return items
+
+    def __iter__(self) -> typing.Iterator[T]:
+        return self._iter(prefetch=self.prefetch)
+
+    def _iter(self, prefetch: int, start: int | None = None) -> typing.Iterator[T]:
+        # with prefetch, the next few pages are fetched in the background
+        # while the caller works through the current one
+        executor = None
+        if prefetch > 0:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=prefetch)
+        ahead: dict[int, concurrent.futures.Future[tuple[spess.models.Meta, list[T]]]] = {}
+
+        try:
+            i = self.bound_low if start is None else start
+            while self.bound_high is None or i < self.bound_high:
+                page = (i // self.pagesize)
+                pageoffset = i - page * self.pagesize
+                if self.bound_high is not None:
+                    pagemax = self.bound_high - page * self.pagesize
+                else:
+                    pagemax = self.pagesize
+                future = ahead.pop(page, None)
+                if future is not None:
+                    meta, data = future.result()
+                else:
+                    meta, data = self._get_page(page=page + 1, limit=self.pagesize)
+                i += min(len(data), pagemax) - pageoffset
+                done = len(data) < self.pagesize
+                if executor and not done:
+                    # never fetch past the last item, as far as we know it
+                    end = meta.total
+                    if self.bound_high is not None:
+                        end = min(end, self.bound_high)
+                    last_page = min(page + prefetch, (end - 1) // self.pagesize)
+                    for next_page in range(page + 1, last_page + 1):
+                        if next_page not in ahead:
+                            ahead[next_page] = executor.submit(self._get_page, page=next_page + 1, limit=self.pagesize)
+                yield from data[pageoffset:pagemax]
+                if done:
+                    break
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import time
 import threading
 import typing
@@ -9,6 +10,10 @@ Timer: typing.TypeAlias = typing.Callable[[], float]
 class Limiter:
     """Base class for rate limit helpers."""
 
+    # limiters are checked on every request, so keep attribute access
+    # on them as cheap as it can be
+    __slots__ = ()
+
     def reset(self) -> None:
         """Reset the limiter state."""
         raise NotImplementedError
@@ -39,6 +44,14 @@ class Limiter:
             time.sleep(wait)
         self.use()
 
+    async def limit_async(self) -> None:
+        """Like :meth:`limit`, but sleeps with asyncio instead of
+        blocking the thread."""
+        wait = self.wait_time
+        if wait is not None:
+            await asyncio.sleep(wait)
+        self.use()
+
     def limit_iter[T](self, it: typing.Iterable[T]) -> typing.Iterable[T]:
         """Transform an iterator to yield objects at a limited rate."""
         for x in it:
@@ -76,6 +89,8 @@ class Limiter:
 
 class Unlimited(Limiter):
     """Dummy limiter that imposes no limit."""
+    __slots__ = ()
+
     def reset(self) -> None:
         pass
 
@@ -90,6 +105,8 @@ class ConstantRate(Limiter):
     """If a request comes in before 1/`rate` has elapsed from the last
     request, wait."""
 
+    __slots__ = ('_delay', '_timer', '_last_t')
+
     def __init__(self, rate: float, margin: float = 0,
                  timer: Timer = time.monotonic) -> None:
         self._delay = (1.0 + margin) / rate
@@ -101,11 +118,8 @@ class ConstantRate(Limiter):
 
     @property
     def wait_time(self) -> float | None:
-        now = self._timer()
-        wait = self._last_t + self._delay - now
-        if wait > 0:
-            return wait
-        return None
+        wait = self._last_t + self._delay - self._timer()
+        return wait if wait > 0 else None
 
     def use(self) -> None:
         self._last_t = self._timer()
@@ -115,6 +129,8 @@ class LeakyBucket(Limiter):
     `burst`. If there is no room in the bucket for a new request, wait
     until there is."""
 
+    __slots__ = ('_rate', '_burst', '_timer', '_last_v', '_last_t')
+
     def __init__(self, rate: float, burst: float, margin: float = 0,
                  timer: Timer = time.monotonic) -> None:
         self._rate = rate * (1.0 - margin)
@@ -131,12 +147,8 @@ class LeakyBucket(Limiter):
 
     @property
     def wait_time(self) -> float | None:
-        now = self._timer()
-        over = self._current(now) + 1 - self._burst
-        if over >= 0:
-            wait = over / self._rate
-            return wait
-        return None
+        over = self._current(self._timer()) + 1 - self._burst
+        return over / self._rate if over >= 0 else None
 
     def use(self) -> None:
         now = self._timer()
@@ -147,7 +159,13 @@ class Windowed(Limiter):
     """Each request either adds to an existing window (if it's valid)
     or opens a new window of length `window` seconds. Each window can
     hold up to `max` requests. If there is no room left, wait until
-    the current window expires and open a new one."""
+    the current window expires and open a new one.
+
+    Note that a full window followed immediately by a fresh one lets
+    through up to 2 * `max` requests in a short burst. If the server
+    is measuring a smooth rate, :class:`LeakyBucket` is a better fit."""
+
+    __slots__ = ('_max', '_window', '_timer', '_window_end', '_window_count', '_full')
 
     def __init__(self, max: int, window: float, margin: float = 0,
                  timer: Timer = time.monotonic) -> None:
@@ -159,13 +177,15 @@ class Windowed(Limiter):
     def reset(self) -> None:
         self._window_end = self._timer()
         self._window_count = 0
+        self._full = self._max <= 0
 
     @property
     def wait_time(self) -> float | None:
-        now = self._timer()
-        wait = self._window_end - now
-
-        if wait > 0 and self._window_count >= self._max:
+        # until the window fills, there's no need to even check the time
+        if not self._full:
+            return None
+        wait = self._window_end - self._timer()
+        if wait > 0:
             return wait
         return None
 
@@ -176,11 +196,14 @@ class Windowed(Limiter):
             self._window_count = 1
         else:
             self._window_count += 1
+        self._full = self._window_count >= self._max
 
 class Any(Limiter):
     """A request goes through if any child limiter allows it. If
     waiting is required, wait the minimum time."""
 
+    __slots__ = ('_children',)
+
     def __init__(self, *children: Limiter) -> None:
         self._children = children
 
@@ -206,6 +229,8 @@ class Any(Limiter):
 class Synced(Limiter):
     """A thread-safe wrapper for a limiter."""
 
+    __slots__ = ('_inner', '_lock')
+
     def __init__(self, inner: Limiter) -> None:
         self._inner = inner
         self._lock = threading.Lock()
@@ -221,3 +246,22 @@ class Synced(Limiter):
     def use(self) -> None:
         with self._lock:
             self._inner.use()
+
+    # check and use under the lock, so concurrent callers can't both
+    # see the same free slot, but never sleep while holding it: async
+    # callers take this lock on the event loop, and must not be made
+    # to wait out another thread's sleep
+    def _reserve(self) -> float | None:
+        with self._lock:
+            wait = self._inner.wait_time
+            if wait is None:
+                self._inner.use()
+            return wait
+
+    def limit(self) -> None:
+        while (wait := self._reserve()) is not None:
+            time.sleep(wait)
+
+    async def limit_async(self) -> None:
+        while (wait := self._reserve()) is not None:
+            await asyncio.sleep(wait)
@@ -6,6 +6,7 @@ import datetime as dt
 import io
 import os
 import pathlib
+import threading
 import typing
 
 import jwt
@@ -15,6 +16,14 @@ import spess.models
 
 __all__ = ['Config', 'Tokens']
 
+# environment variables are named like SPESS_URL
+_ENV_PREFIX = __package__.upper() + '_'
+
+def _parse_bool(s: str) -> bool:
+    if s.lower() == 'false' or s.strip('0') == '':
+        return False
+    return True
+
 @dataclasses.dataclass
 class Config:
     """Configuration info for :class:`spess.client.Client`.
@@ -37,7 +46,9 @@ class Config:
         @contextlib.contextmanager
         def _replace_file(self) -> typing.Iterator[typing.TextIO]:
             if not self.write:
+                # read-only, so throw away whatever gets written
                 yield io.StringIO()
+                return
 
             self.path.parent.mkdir(parents=True, exist_ok=True)
             tmp = self.path.with_name(self.path.name + '.new')
@@ -73,6 +84,13 @@ class Config:
     #: in `tokens.txt` will be used.
     agent_token: spess.models.Token | str | None = None
 
+    #: How long, in seconds, to reuse the response to a GET request.
+    #:
+    #: A cached response is dropped as soon as any POST or PATCH is
+    #: made, since that may have changed it. The default of ``0``
+    #: disables the cache entirely.
+    cache_ttl: float = 0.0
+
     @classmethod
     def default(cls) -> typing.Self:
         """Use the default paths and configuration."""
@@ -86,6 +104,7 @@ class Config:
             url: str | None = None,
             account_token: spess.models.Token | str | None = None,
             agent_token: spess.models.Token | str | None = None,
+            cache_ttl: float | None = None,
     ) -> typing.Self:
         """Use the default paths and configuration, but override
         certain values.
@@ -100,21 +119,19 @@ class Config:
         url = cls._get_env('URL', str, url, None)
         account_token = cls._get_token('ACCOUNT_TOKEN', account_token)
         agent_token = cls._get_token('AGENT_TOKEN', agent_token)
+        cache_ttl = cls._get_env('CACHE_TTL', float, cache_ttl, 0.0)
 
         return cls(
             tokens = tokens,
             url = url,
             account_token = account_token,
             agent_token = agent_token,
+            cache_ttl = cache_ttl,
         )
 
     @classmethod
     def _get_bool(cls, env: str, arg: bool | None, default: bool) -> bool:
-        def parse_bool(s):
-            if b.lower() == 'false' or b.strip('0') == '':
-                return False
-            return True
-        return cls._get_env(env, parse_bool, arg, default)
+        return cls._get_env(env, _parse_bool, arg, default)
 
     @classmethod
     def _get_path(cls, env: str, arg: str | pathlib.Path | None, base: str, leaf: str) -> pathlib.Path:
@@ -131,37 +148,71 @@ class Config:
 
     @classmethod
     def _get_env[T](cls, env: str, f: typing.Callable[[str], T], arg: T | None, default: T) -> T:
-        env = f'{__package__.upper()}_{env}'
         try:
-            return f(os.environ[env])
+            return f(os.environ[_ENV_PREFIX + env])
         except KeyError:
             return arg if arg is not None else default
 
+# account tokens by identifier, agent tokens by identifier, and agent
+# tokens by reset date
+_TokenIndexes: typing.TypeAlias = tuple[
+    dict[str, list[spess.models.Token]],
+    dict[str, list[spess.models.Token]],
+    dict[dt.date | None, list[spess.models.Token]],
+]
+
 @dataclasses.dataclass
 class Tokens(Config.File):
-    """Tokens loaded from `tokens.txt`."""
+    """Tokens loaded from `tokens.txt`.
+
+    The file is read the first time a token is asked for, either
+    through :attr:`account` and :attr:`agent` or the ``get_*``
+    methods, or when :meth:`load` is called.
+    """
+
+    _account: list[spess.models.Token] = dataclasses.field(default_factory=list, init=False)
+    _agent: list[spess.models.Token] = dataclasses.field(default_factory=list, init=False)
 
-    #: Account Tokens
-    account: list[spess.models.Token] = dataclasses.field(default_factory=list)
-    #: Agent Tokens
-    agent: list[spess.models.Token] = dataclasses.field(default_factory=list)
+    @property
+    def account(self) -> list[spess.models.Token]:
+        """Account Tokens"""
+        self.load()
+        return self._account
 
-    def _resolve_token(self, tokens: list[spess.models.Token], tok: spess.models.Token | str | None) -> typing.Iterator[spess.models.Token]:
+    @account.setter
+    def account(self, value: list[spess.models.Token]) -> None:
+        self.load()
+        self._account = value
+
+    @property
+    def agent(self) -> list[spess.models.Token]:
+        """Agent Tokens"""
+        self.load()
+        return self._agent
+
+    @agent.setter
+    def agent(self, value: list[spess.models.Token]) -> None:
+        self.load()
+        self._agent = value
+
+    def _resolve_token(self, tokens: list[spess.models.Token], by_id: dict[str, list[spess.models.Token]], tok: spess.models.Token | str | None) -> typing.Iterator[spess.models.Token]:
         if isinstance(tok, spess.models.Token):
             yield tok
             return
         if isinstance(tok, str) and spess.models.Token.is_token(tok):
             yield spess.models.Token.from_str(tok)
             return
-        for token in tokens:
-            if tok is None or tok == token.identifier:
-                yield token
+        if tok is None:
+            yield from tokens
+        else:
+            yield from by_id.get(tok, ())
 
     def get_account(self, tok: spess.models.Token | str | None = None) -> spess.models.Token:
         """Get an account token, directly or by identifier. If ``None``,
         choose the most recent account token.
         """
-        for token in self._resolve_token(self.account, tok):
+        account_by_id, _, _ = self._indexes()
+        for token in self._resolve_token(self.account, account_by_id, tok):
             return token
         if self.account:
             raise ValueError(f'account token for {tok!r} not found')
@@ -173,7 +224,12 @@ class Tokens(Config.File):
 
         This will only return tokens valid for the given ``reset_date``.
         """
-        for token in self._resolve_token(self.agent, tok):
+        _, agent_by_id, agent_by_reset = self._indexes()
+        candidates = self.agent
+        if tok is None:
+            # most of the time, this is all we need
+            candidates = agent_by_reset.get(reset_date, [])
+        for token in self._resolve_token(candidates, agent_by_id, tok):
             if token.reset_date == reset_date:
                 return token
         if isinstance(tok, spess.models.Token):
@@ -183,35 +239,76 @@ class Tokens(Config.File):
         raise RuntimeError('no agent tokens available')
 
     def __post_init__(self) -> None:
-        self._read()
+        # reading and decoding every token waits until one is needed
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._index: tuple[tuple[object, ...], _TokenIndexes] = ((), ({}, {}, {}))
+
+    def load(self) -> None:
+        """Read `tokens.txt`, if it hasn't been read already."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._read()
+                self._loaded = True
 
     def _read(self) -> None:
+        f: typing.ContextManager[typing.TextIO]
         try:
-            with self._read_file() as f:
-                lines = f.readlines()
+            f = self._read_file()
         except IOError:
-            lines = []
-
-        for i, line in enumerate(lines):
-            line = line.split('#', 1)[0].strip()
-            if not line:
-                continue
-
-            try:
-                tok = spess.models.Token.from_str(line)
-            except Exception:
-                raise ValueError(f'could not parse token on line {i+1} of {self.path}')
-            match tok.sub:
-                case 'account-token':
-                    self.account.append(tok)
-                case 'agent-token':
-                    self.agent.append(tok)
-                case v:
-                    raise ValueError(f'unknown token type {v!r}')
-
-        self.account.sort(key=lambda t: t.iat, reverse=True)
-        self.agent.sort(key=lambda t: t.iat, reverse=True)
+            f = io.StringIO()
+
+        # go line by line, rather than holding the whole file at once
+        with f as lines:
+            for i, raw in enumerate(lines, 1):
+                line = raw.partition('#')[0].strip()
+                if not line:
+                    continue
+
+                try:
+                    tok = spess.models.Token.from_str(line)
+                except Exception:
+                    raise ValueError(f'could not parse token on line {i} of {self.path}')
+                match tok.sub:
+                    case 'account-token':
+                        self._account.append(tok)
+                    case 'agent-token':
+                        self._agent.append(tok)
+                    case v:
+                        raise ValueError(f'unknown token type {v!r}')
+
+        self._account.sort(key=lambda t: t.iat, reverse=True)
+        self._agent.sort(key=lambda t: t.iat, reverse=True)
+
+    def _indexes(self) -> _TokenIndexes:
+        # index by identifier, and agents by reset, keeping the same
+        # order as the lists. the lists are public and may be changed
+        # or replaced at any time, so rebuild whenever they differ from
+        # what was last indexed
+        account = self.account
+        agent = self.agent
+        indexed = (account, *account, None, agent, *agent)
+        last_indexed, indexes = self._index
+        if len(indexed) == len(last_indexed) and all(a is b for a, b in zip(indexed, last_indexed)):
+            return indexes
+
+        account_by_id: dict[str, list[spess.models.Token]] = {}
+        agent_by_id: dict[str, list[spess.models.Token]] = {}
+        agent_by_reset: dict[dt.date | None, list[spess.models.Token]] = {}
+        for token in account:
+            account_by_id.setdefault(token.identifier, []).append(token)
+        for token in agent:
+            agent_by_id.setdefault(token.identifier, []).append(token)
+            agent_by_reset.setdefault(token.reset_date, []).append(token)
+
+        indexes = (account_by_id, agent_by_id, agent_by_reset)
+        self._index = (indexed, indexes)
+        return indexes
 
 if __name__ == '__main__':
     from rich import print
-    print(Config.default())
+    config = Config.default()
+    config.tokens.load()
+    print(config)
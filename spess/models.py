@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import dataclasses
 import datetime as dt
+import functools
 import typing
 
 import jwt
@@ -22,7 +23,22 @@ __all__ = spess._generated.models.__all__
 __all__ += ['Token']
 __all__.sort()
 
-@dataclasses.dataclass
+# the same token strings get checked and parsed over and over
+@functools.lru_cache(maxsize=128)
+def _decode_claims(token: str) -> dict[str, typing.Any]:
+    return jwt.decode(token, options={'verify_signature': False})
+
+# lru_cache doesn't remember exceptions, so identifiers that fail to
+# decode need their own cache
+@functools.lru_cache(maxsize=128)
+def _is_token(token: str) -> bool:
+    try:
+        _decode_claims(token)
+        return True
+    except Exception:
+        return False
+
+@dataclasses.dataclass(slots=True)
 class Token:
     """`spacetraders.io` Account or Agent Token"""
 
@@ -55,16 +71,13 @@ class Token:
     @classmethod
     def is_token(cls, token: str) -> bool:
         """Returns ``True`` if this string looks like a token string."""
-        try:
-            jwt.decode(token, options={'verify_signature': False})
-            return True
-        except Exception:
-            return False
+        return _is_token(token)
 
     @classmethod
     def from_str(cls, token: str) -> typing.Self:
         """Parse a token string into a ``Token``."""
-        info = jwt.decode(token, options={'verify_signature': False})
+        # copy, since the cached claims are shared and we pop from these
+        info = dict(_decode_claims(token))
         from_json = spess._json.from_json
 
         try:
@@ -1,3 +1,5 @@
+import argparse
+import hashlib
 import json
 import pathlib
 import sys
@@ -12,9 +14,34 @@ import spessgen.spec
 import spessgen.types as types
 import spessgen.writer as writer
 
+def _digest(sources: list[pathlib.Path]) -> str:
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(f'{source.parent.name}/{source.name}'.encode())
+        digest.update(source.read_bytes() if source.exists() else b'')
+    return digest.hexdigest()
+
 def main() -> None:
+    parser = argparse.ArgumentParser(prog='spessgen')
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate and check even if nothing has changed')
+    args = parser.parse_args()
+
     here = pathlib.Path(__file__).parent
-    generated = here / '..' / 'spess' / '_generated'
+    spess_dir = here / '..' / 'spess'
+    generated = spess_dir / '_generated'
+    outputs = [generated / name for name in ['models.py', 'responses.py', 'client.py']]
+
+    # skip generating and checking entirely if nothing that goes into
+    # the run has changed since the last successful one: the spec, the
+    # generator, the runtime modules mypy checks the output against,
+    # and the output itself, in case it was edited by hand
+    inputs = [here / 'spacetraders.json'] + sorted(here.glob('*.py')) + sorted(spess_dir.glob('*.py'))
+    cache = generated / '.spessgen.cache'
+    if not args.force and all(p.exists() for p in outputs) and cache.exists() and cache.read_text() == _digest(inputs + outputs):
+        print('generated files are up to date')
+        return
+
     with open(here / 'spacetraders.json') as f:
         spec = spessgen.spec.Spec.from_json(json.load(f))
 
@@ -27,9 +54,10 @@ def main() -> None:
             writer.generate(f)
         checkfiles.append(str(path))
 
-    generate(generated / 'models.py', models.ModelWriter(converter, 'models'))
-    generate(generated / 'responses.py', models.ModelWriter(converter, 'responses'))
-    generate(generated / 'client.py', client.ClientWriter(converter, 'client'))
+    models_py, responses_py, client_py = outputs
+    generate(models_py, models.ModelWriter(converter, 'models'))
+    generate(responses_py, models.ModelWriter(converter, 'responses'))
+    generate(client_py, client.ClientWriter(converter, 'client'))
 
     #print(resolver.types)
     #print(converter.methods)
@@ -39,6 +67,8 @@ def main() -> None:
         print(stdout)
     if stderr:
         print(stderr, file=sys.stderr)
+    if status == 0:
+        cache.write_text(_digest(inputs + outputs))
     sys.exit(status)
 
 if __name__ == '__main__':
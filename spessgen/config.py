@@ -1,4 +1,4 @@
-import dataclasses
+from types import MappingProxyType
 import typing
 
 # Many of these overrides refer to an item by spec_name. These are derived
@@ -26,16 +26,19 @@ import typing
 #        response type: get-foo.response
 
 # python keywords to avoid in python names
-KEYWORDS: set[str] = {
+KEYWORDS: frozenset[str] = frozenset({
     'yield',
-}
+})
+
+# shared default for lookups in the nested tables below
+EMPTY: typing.Mapping[str, str] = MappingProxyType({})
 
 #
 # Fixes
 #
 
 # type names, from spec_name to local python type name (no parent)
-TYPE_NAME: dict[str, str] = {
+TYPE_NAME: typing.Mapping[str, str] = MappingProxyType({
     # info/symbol swap, give symbol a shorter name
     'FactionTrait': 'FactionTraitInfo',
     'FactionTraitSymbol': 'FactionTrait',
@@ -49,66 +52,44 @@ TYPE_NAME: dict[str, str] = {
     'WaypointModifierSymbol': 'WaypointModifier',
     'WaypointTrait': 'WaypointTraitInfo',
     'WaypointTraitSymbol': 'WaypointTrait',
-}
+})
 
 # field type overrides, from spec_name, field_json_name to full python type
-STRUCT_FIELD_TYPE: dict[str, dict[str, str]] = {
+STRUCT_FIELD_TYPE: typing.Mapping[tuple[str, str], str] = MappingProxyType({
     # agents don't use faction symbol type
-    'Agent': {
-        'startingFaction': 'models.FactionSymbol',
-    },
+    ('Agent', 'startingFaction'): 'models.FactionSymbol',
     # actually most things don't use the faction symbol type
-    'Contract': {
-        'factionSymbol': 'models.FactionSymbol',
-    },
+    ('Contract', 'factionSymbol'): 'models.FactionSymbol',
     # missing trade symbol
-    'ContractDeliverGood': {
-        'tradeSymbol': 'models.TradeSymbol',
-    },
+    ('ContractDeliverGood', 'tradeSymbol'): 'models.TradeSymbol',
     # these are almost certainly ints, not floats
-    'get-error-codes.response.errorCodes': {
-        'code': 'int',
-    },
+    ('get-error-codes.response.errorCodes', 'code'): 'int',
     # missing faction symbol
-    'get-my-factions.response': {
-        'symbol': 'models.FactionSymbol',
-    },
+    ('get-my-factions.response', 'symbol'): 'models.FactionSymbol',
     # this is a date, not a str
-    'get-status.response': {
-        'resetDate': 'date',
-    },
+    ('get-status.response', 'resetDate'): 'date',
     # this is a datetime, not str
-    'get-status.response.health': {
-        'lastMarketUpdate': 'datetime',
-    },
+    ('get-status.response.health', 'lastMarketUpdate'): 'datetime',
     # this is a datetime, not str
-    'get-status.response.serverResets': {
-        'next': 'datetime',
-    },
+    ('get-status.response.serverResets', 'next'): 'datetime',
     # agents don't use faction symbol type
-    'PublicAgent': {
-        'startingFaction': 'models.FactionSymbol',
-    },
+    ('PublicAgent', 'startingFaction'): 'models.FactionSymbol',
     # more missing trade symbol
-    'ShipModificationTransaction': {
-        'tradeSymbol': 'models.TradeSymbol',
-    },
+    ('ShipModificationTransaction', 'tradeSymbol'): 'models.TradeSymbol',
     # more missing faction symbol
-    'ShipRegistration': {
-        'factionSymbol': 'models.FactionSymbol',
-    },
-}
+    ('ShipRegistration', 'factionSymbol'): 'models.FactionSymbol',
+})
 
 # name of methods to skip, by spec_name (aka operationId)
-METHOD_SKIP: set[str] = {
+METHOD_SKIP: frozenset[str] = frozenset({
     # needs support for additionalProperties on objects
     'get-supply-chain',
     # needs websockets
     'websocket-departure-events',
-}
+})
 
 # method names, from spec_name to python name
-METHOD_NAME: dict[str, str] = {
+METHOD_NAME: typing.Mapping[str, str] = MappingProxyType({
     # don't auto-remove get- on these, it conflicts with another method
     'get-repair-ship': 'get_repair_ship',
     'get-scrap-ship': 'get_scrap_ship',
@@ -116,25 +97,22 @@ METHOD_NAME: dict[str, str] = {
     'get-my-ship': 'ship',
     'get-my-ships': 'ships',
     'get-my-ship-cargo': 'ship_cargo',
-}
+})
 
 # method argument names, from spec_name, <type>.jsonArgName to python name
 # type is one of path, query, body
 # a lone 'body' refers to a whole-body argument
-METHOD_ARG_NAME: dict[str, dict[str, str]] = {
+METHOD_ARG_NAME: typing.Mapping[tuple[str, str], str] = MappingProxyType({
     # transfer-cargo has ambiguous shipSymbols
-    'transfer-cargo': {
-        'body.shipSymbol': 'to_ship',
-        'path.shipSymbol': 'from_ship',
-    },
-}
+    ('transfer-cargo', 'body.shipSymbol'): 'to_ship',
+    ('transfer-cargo', 'path.shipSymbol'): 'from_ship',
+})
 
 #
 # Extensions. Unlike above, *these* work in python names
 #
 
-@dataclasses.dataclass
-class Keyed:
+class Keyed(typing.NamedTuple):
     # KeyClassName
     name: str
     # new_arg_name
@@ -145,29 +123,41 @@ class Keyed:
     foreign: str
 
     def _map_types(self, f: typing.Callable[[str], str]) -> typing.Self:
-        return dataclasses.replace(self, name=f(self.name))
+        return self._replace(name=f(self.name))
 
 # types with keys, python.Name to (new_arg_name, local_name, foreign/arg_name)
-KEYED_TYPES: dict[str, Keyed] = {
+KEYED_TYPES: typing.Mapping[str, Keyed] = MappingProxyType({
     'models.PublicAgent': Keyed('AgentLike', 'agent', 'symbol', 'agent_symbol'),
     'models.Contract': Keyed('ContractLike', 'contract', 'id', 'contract_id'),
     'models.Ship': Keyed('ShipLike', 'ship', 'symbol', 'ship_symbol'),
     'models.System': Keyed('SystemLike', 'system', 'symbol', 'system_symbol'),
     'models.Waypoint': Keyed('WaypointLike', 'waypoint', 'symbol', 'waypoint_symbol'),
-}
+})
+
+# the same, but looked up from foreign/arg_name to python.Name
+KEYED_TYPES_BY_FOREIGN: typing.Mapping[str, str] = MappingProxyType({
+    keyed.foreign: k for k, keyed in KEYED_TYPES.items()
+})
+
+# generated arguments and attributes are named after these, so they
+# must not collide
+if len(KEYED_TYPES_BY_FOREIGN) != len(KEYED_TYPES):
+    raise RuntimeError('duplicate Keyed.foreign')
+if len({keyed.arg for keyed in KEYED_TYPES.values()}) != len(KEYED_TYPES):
+    raise RuntimeError('duplicate Keyed.arg')
 
 # types with keys that also necessarily provide other keys
 # from SuperKeyedType, SubKeyedType to convert_if_missing
-KEY_CONSOLIDATE: dict[str, dict[str, str]] = {
+KEY_CONSOLIDATE: typing.Mapping[str, typing.Mapping[str, str]] = MappingProxyType({
     # waypoints imply a system
     'models.Waypoint': {
         'models.System': 'self._waypoint_to_system',
     }
-}
+})
 
 # extra property aliases
 # from PyName, prop_name to expr
-PROPERTIES: dict[str, dict[str, str]] = {
+PROPERTIES: typing.Mapping[str, typing.Mapping[str, str]] = MappingProxyType({
     # Agent is a sort of PublicAgent. Sort of.
     'models.Agent': {
         'agent_symbol': 'self.symbol',
@@ -225,53 +215,47 @@ PROPERTIES: dict[str, dict[str, str]] = {
     'models.WaypointOrbital': {
         'waypoint_symbol': 'self.symbol',
     },
-}
+})
 
 # override convenience method names, from PyType, spec_name to py_method_name
-CONVENIENCE_METHOD_NAME: dict[str, dict[str, str]] = {
+CONVENIENCE_METHOD_NAME: typing.Mapping[tuple[str, str], str] = MappingProxyType({
     # this is, by rights, an update function
-    'models.PublicAgent': {
-        'get-agent': 'update',
-    },
+    ('models.PublicAgent', 'get-agent'): 'update',
     # prevent collision with attributes
-    'models.Ship': {
-        'get-mounts': 'update_mounts',
-        'get-my-ship-cargo': 'update_cargo',
-        'get-ship-cooldown': 'update_cooldown',
-        'get-ship-modules': 'update_modules',
-        'get-ship-nav': 'update_nav',
-    },
+    ('models.Ship', 'get-mounts'): 'update_mounts',
+    ('models.Ship', 'get-my-ship-cargo'): 'update_cargo',
+    ('models.Ship', 'get-ship-cooldown'): 'update_cooldown',
+    ('models.Ship', 'get-ship-modules'): 'update_modules',
+    ('models.Ship', 'get-ship-nav'): 'update_nav',
     # prevent collision with attributes
-    'models.System': {
-        'get-system-waypoints': 'get_waypoints',
-    },
-}
+    ('models.System', 'get-system-waypoints'): 'get_waypoints',
+})
 
-CONVENIENCE_METHOD_EXTRA: dict[str, dict[str, str]] = {
+CONVENIENCE_METHOD_EXTRA: typing.Mapping[str, typing.Mapping[str, str]] = MappingProxyType({
     # add an update to Agent, and a link to the PublicAgent
     'models.Agent': {
         'get-agent': 'public',
         'get-my-agent': 'update',
     }
-}
+})
 
-# add wait methods. map from PyType to [expr, ...]
+# add wait methods. map from PyType to (expr, ...)
 # expr is a datetime representing when the wait is over
-WAIT: dict[str, list[str]] = {
+WAIT: typing.Mapping[str, tuple[str, ...]] = MappingProxyType({
     # cooldown has a direct expiration
-    'models.Cooldown': ['self.expiration'],
+    'models.Cooldown': ('self.expiration',),
     # ships have two possible waits
-    'models.Ship': ['self.cooldown.expiration', 'self.nav.route.arrival'],
+    'models.Ship': ('self.cooldown.expiration', 'self.nav.route.arrival'),
     # waiting on nav waits on route
-    'models.ShipNav': ['self.route.arrival'],
+    'models.ShipNav': ('self.route.arrival',),
     # routes have an arrival time
-    'models.ShipNavRoute': ['self.arrival'],
-}
+    'models.ShipNavRoute': ('self.arrival',),
+})
 
 # code to run to perform sync on responses
 # map from PyType to codestr | None, where codestr is a format string
 # accepting a value of that type. None indicates explicit ignore.
-SYNC_CODE: dict[str, str | None] = {
+SYNC_CODE: typing.Mapping[str, str | None] = MappingProxyType({
     # false positives from sync heuristic
     'models.FactionSymbol': None,
 
@@ -289,4 +273,17 @@ SYNC_CODE: dict[str, str | None] = {
     'list[models.ShipModule]': 'self._sync_ship_modules({}, ship)',
     'list[models.ShipMount]': 'self._sync_ship_mounts({}, ship)',
     'models.ShipNav': 'self._sync_ship_nav({}, ship)',
-}
+})
+
+#
+# Consistency checks, so config mistakes show up here and not halfway
+# through generating
+#
+
+if _bad := METHOD_SKIP & METHOD_NAME.keys():
+    raise RuntimeError(f'method both renamed and skipped: {sorted(_bad)!r}')
+if _bad := METHOD_SKIP & {spec_name for _, spec_name in CONVENIENCE_METHOD_NAME}:
+    raise RuntimeError(f'convenience method for skipped method: {sorted(_bad)!r}')
+for _super, _subs in KEY_CONSOLIDATE.items():
+    if _super not in KEYED_TYPES or not _subs.keys() <= KEYED_TYPES.keys():
+        raise RuntimeError(f'consolidating unkeyed type: {_super!r}')
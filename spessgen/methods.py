@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import typing
 
 import humps
@@ -7,6 +8,13 @@ from spessgen.config import *
 import spessgen.spec as spec
 import spessgen.types as types
 
+# the same few names come up over and over across the whole spec
+_decamelize = functools.lru_cache(maxsize=None)(humps.decamelize)
+_dekebabize = functools.lru_cache(maxsize=None)(humps.dekebabize)
+
+# METHOD_ARG_NAME prefix for each kind of parameter
+_ARG_STEM = {i: i.value.lower() + '.' for i in spec.Operation.Parameter.In}
+
 @dataclasses.dataclass
 class Method:
     @dataclasses.dataclass
@@ -28,12 +36,13 @@ class Method:
     spec_name: str
     py_name: str
     doc: str | None
-    tags: list[str]
+    tags: tuple[str, ...]
     method: spec.Path.Method
     path: str
 
-    path_args: list[Argument]
-    query_args: list[Argument]
+    # fixed once the method is built, so tuples
+    path_args: tuple[Argument, ...]
+    query_args: tuple[Argument, ...]
     body_args: list[Argument] | Argument
 
     py_result: str
@@ -42,11 +51,12 @@ class Method:
 
     sync_code: list[str]
 
-    @property
-    def all_args(self) -> list[Argument]:
+    # the argument lists are complete by the time anything asks for this
+    @functools.cached_property
+    def all_args(self) -> tuple[Argument, ...]:
         if isinstance(self.body_args, list):
-            return self.path_args + self.query_args + self.body_args
-        return self.path_args + self.query_args + [self.body_args]
+            return self.path_args + self.query_args + tuple(self.body_args)
+        return self.path_args + self.query_args + (self.body_args,)
 
 @dataclasses.dataclass
 class Convenience:
@@ -66,7 +76,7 @@ class Convenience:
 
     doc: str | None = None
     doc_rest: bool = False
-    tags: list[str] = dataclasses.field(default_factory=list)
+    tags: tuple[str, ...] = ()
     paginated: bool = False
 
 class Converter:
@@ -76,6 +86,13 @@ class Converter:
         self.responses_module: str = responses_module if responses_module else resolver.models_module
         self.methods: dict[str, Method] = {}
 
+        # methods sort by where their tags appear in the spec, and
+        # unknown tags sort after all the known ones
+        self._tag_rank: dict[str, int] = {}
+        for i, tag in enumerate(spec.tags):
+            self._tag_rank.setdefault(tag.name, i)
+        self._unknown_tag_rank = len(spec.tags)
+
         for path, info in spec.paths.items():
             self.add_path(path, info)
 
@@ -87,10 +104,11 @@ class Converter:
         # returns new_arg_name, KeyType (if keyed)
         if py_arg_type != 'str':
             return (py_arg_name, None)
-        for k, spec in KEYED_TYPES.items():
-            if py_arg_name == spec.foreign:
-                return (spec.arg, k)
-        return (py_arg_name, None)
+        try:
+            k = KEYED_TYPES_BY_FOREIGN[py_arg_name]
+        except KeyError:
+            return (py_arg_name, None)
+        return (KEYED_TYPES[k].arg, k)
 
     def _collect_args(self, spec_name: str, op: spec.Operation) -> tuple[list[Method.Argument], list[Method.Argument], bool]:
         path_args = []
@@ -107,11 +125,10 @@ class Converter:
             py_type = self.resolver.resolve(spec_name + '.' + json_name, param.schema, parent=self.resolver.models_module)
 
             try:
-                stem = param.in_.value.lower() + '.'
-                py_name = METHOD_ARG_NAME.get(spec_name, {})[stem + json_name]
+                py_name = METHOD_ARG_NAME[spec_name, _ARG_STEM[param.in_] + json_name]
                 _, keyed = self._resolve_key(spec_name, py_name, py_type)
             except KeyError:
-                py_name = humps.decamelize(json_name)
+                py_name = _decamelize(json_name)
                 if py_name in KEYWORDS:
                     py_name += '_'
                 py_name, keyed = self._resolve_key(spec_name, py_name, py_type)
@@ -155,10 +172,10 @@ class Converter:
             # premade type, use it wholesale
             py_type = self.resolver.resolve(spec_name + '.body', schema, parent=self.resolver.models_module, name_hint=py_name)
             try:
-                py_name = METHOD_ARG_NAME.get(spec_name, {})['body']
+                py_name = METHOD_ARG_NAME[spec_name, 'body']
                 _, keyed = self._resolve_key(spec_name, py_name, py_type)
             except KeyError:
-                py_name = humps.decamelize(py_type.rsplit('.')[-1])
+                py_name = _decamelize(py_type.rsplit('.')[-1])
                 if py_name in KEYWORDS:
                     py_name += '_'
                 py_name, keyed = self._resolve_key(spec_name, py_name, py_type)
@@ -180,7 +197,7 @@ class Converter:
             args = []
             for field in ty.definition.fields.values():
                 try:
-                    py_name = METHOD_ARG_NAME.get(spec_name, {})['body.' + field.json_name]
+                    py_name = METHOD_ARG_NAME[spec_name, 'body.' + field.json_name]
                     _, keyed = self._resolve_key(spec_name, py_name, field.py_type)
                 except KeyError:
                     py_name = field.py_name
@@ -211,12 +228,10 @@ class Converter:
         schema = self._json_schema(f'{spec_name} response', first.content)
 
         adhoc = True
-        props = set()
         if isinstance(schema, spec.Schema):
             if schema.properties:
-                props = set(schema.properties.keys())
                 if schema.type == spec.Schema.Type.OBJECT:
-                    if props.issubset({'data', 'meta'}):
+                    if schema.properties.keys() <= {'data', 'meta'}:
                         adhoc = False
                         schema = schema.properties['data']
 
@@ -247,6 +262,11 @@ class Converter:
         except KeyError:
             pass
 
+        # keyed types are always keyed like themselves, so a type that
+        # isn't keyed like anything can't match the first argument
+        if not ty.as_keyed:
+            return (False, None)
+
         for arg in m.all_args:
             if arg.consolidated:
                 continue
@@ -255,7 +275,7 @@ class Converter:
                 # first argument is us
                 return (True, None)
             elif arg.keyed in ty.as_keyed:
-                key_common = humps.decamelize(arg.keyed.rsplit('.', 1)[-1])
+                key_common = _decamelize(arg.keyed.rsplit('.', 1)[-1])
                 if key_common == m.py_name:
                     # first argument is *like* us, and this is an update
                     return (True, None)
@@ -272,10 +292,10 @@ class Converter:
 
         if not method_name:
             try:
-                method_name = CONVENIENCE_METHOD_NAME[ty.py_name][m.spec_name]
+                method_name = CONVENIENCE_METHOD_NAME[ty.py_name, m.spec_name]
             except KeyError:
                 method_name = m.py_name
-                common = humps.decamelize(ty.py_name.rsplit('.', 1)[-1])
+                common = _decamelize(ty.py_name.rsplit('.', 1)[-1])
                 if method_name == common:
                     method_name = 'update'
                 if method_name.endswith('_' + common):
@@ -408,7 +428,7 @@ class Converter:
             py_name = spec_name
             if py_name.startswith('get-'):
                 py_name = py_name.split('-', 1)[1]
-            py_name = humps.dekebabize(py_name)
+            py_name = _dekebabize(py_name)
             if py_name in KEYWORDS:
                 py_name += '_'
 
@@ -436,12 +456,12 @@ class Converter:
             spec_name = spec_name,
             py_name = py_name,
             doc = doc,
-            tags = op.tags,
+            tags = tuple(op.tags),
             path = path,
             method = method,
 
-            path_args = path_args,
-            query_args = query_args,
+            path_args = tuple(path_args),
+            query_args = tuple(query_args),
             body_args = body_args,
 
             py_result = py_result,
@@ -454,11 +474,17 @@ class Converter:
         for arg in m.all_args:
             if not arg.keyed:
                 continue
-            for sub_key, convert in KEY_CONSOLIDATE.get(arg.keyed, {}).items():
+            for sub_key, convert in KEY_CONSOLIDATE.get(arg.keyed, EMPTY).items():
                 self._consolidate(m, arg, sub_key, convert)
 
-        for ty in self.resolver.iter_flat():
-            self._add_convenience(m, ty)
+        # only a keyed first argument or an explicit extra can make a
+        # convenience method, so most methods can skip walking every type.
+        # types are still being added as methods are converted, so there
+        # is no fixed index to look candidates up in instead
+        first = next((arg for arg in m.all_args if not arg.consolidated), None)
+        if (first is not None and first.keyed) or any(m.spec_name in extra for extra in CONVENIENCE_METHOD_EXTRA.values()):
+            for ty in self.resolver.iter_flat():
+                self._add_convenience(m, ty)
 
         self._add_result_sync(m)
 
@@ -473,17 +499,10 @@ class Converter:
             predicate: typing.Callable[[M], bool] | None = None,
     ) -> typing.Iterator[tuple[M, str | None]]:
         methods_keyed = []
-        spec_tags = [tag.name for tag in self.spec.tags]
         for method in methods.values():
             if predicate is not None and not predicate(method):
                 continue
-            key = []
-            for tag in method.tags:
-                if tag in spec_tags:
-                    key.append((spec_tags.index(tag), tag))
-                else:
-                    key.append((len(spec_tags), tag))
-            key.sort()
+            key = sorted((self._tag_rank.get(tag, self._unknown_tag_rank), tag) for tag in method.tags)
             methods_keyed.append((key, method))
 
         methods_keyed.sort(key=lambda t: t[0])
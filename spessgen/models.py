@@ -11,6 +11,7 @@ class ModelWriter(write_types.WriteTypes):
         self.print('from __future__ import annotations')
         self.print()
         self.print('import dataclasses')
+        self.print('import sys')
         self.print('import typing')
         self.print()
         self.print('import spess._backend as backend')
@@ -18,19 +19,21 @@ class ModelWriter(write_types.WriteTypes):
         if self.resolver.models_module != self.module:
             models = self.resolver.models_module
             self.print(f'import spess.{models} as {models}')
-        self.print(f'from spess._model_bases import date, datetime, Enum, LocalClient, Synced, Keyed')
+        self.print(f'from spess._model_bases import date, datetime, Enum, LocalClient, Waitable, Synced, Keyed')
         self.print('from spess._paged import Paged')
         if self.converter.responses_module != self.module:
             responses = self.converter.responses_module
             self.print(f'import spess.{responses} as {responses}')
 
         self.print()
-        all_types = []
-        for t, _ in self.resolver.iter_tree(self.module, absolute=True):
-            all_types.append(t.py_name)
-            if t.keyed:
-                all_types.append(t.keyed.name)
-        all_types.sort()
+        # top-level names are the same whether or not the tree is
+        # absolute, so walk it once for both __all__ and the types
+        tree = list(self.resolver.iter_tree(self.module))
+        all_types = sorted(
+            name
+            for t, _ in tree
+            for name in ((t.py_name, t.keyed.name) if t.keyed else (t.py_name,))
+        )
         self.dunder_all(all_types)
 
-        self.write_types(self.resolver.iter_tree(self.module))
+        self.write_types(iter(tree))
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import dataclasses
+import functools
 import os.path
 import typing
 
@@ -11,6 +12,9 @@ from spessgen.config import *
 import spessgen.methods as methods
 import spessgen.spec as spec
 
+# field names repeat across many schemas
+_decamelize = functools.lru_cache(maxsize=None)(humps.decamelize)
+
 WAIT_DOCS = ' '.join([
     'Wait interactively until this object is ready for more actions.',
     'For a non-interactive, async wait, await this object directly.',
@@ -167,12 +171,12 @@ class Resolver:
 
         fields: dict[str, Struct.Field] = {}
         for k, v in properties.items():
-            py_name = humps.decamelize(k)
+            py_name = _decamelize(k)
             if py_name in KEYWORDS:
                 py_name += '_'
 
             py_type = self.resolve(spec_name + '.' + k, v, parent=py_parent_name)
-            py_type = STRUCT_FIELD_TYPE.get(spec_name, {}).get(k, py_type)
+            py_type = STRUCT_FIELD_TYPE.get((spec_name, k), py_type)
 
             fields[py_name] = Struct.Field(
                 py_name = py_name,
@@ -192,7 +196,7 @@ class Resolver:
         common = len(os.path.commonprefix(schema.enum))
         variants = []
         for var in schema.enum:
-            pyvar = humps.decamelize(var[common:])
+            pyvar = _decamelize(var[common:])
             if pyvar in KEYWORDS:
                 pyvar += '_'
             variants.append((pyvar, var))
@@ -206,7 +210,7 @@ class Resolver:
                 ty.as_keyed.append(key_type)
 
     def _add_convenience(self, ty: Type) -> None:
-        wait = WAIT.get(ty.py_name, [])
+        wait = WAIT.get(ty.py_name, ())
         if wait:
             ty.check_name('wait')
             ty.convenience['wait'] = methods.Convenience(
@@ -221,18 +225,20 @@ class Resolver:
                 py_impl = 'backend._wait',
                 doc = WAIT_DOCS,
                 doc_rest = True,
-                tags = ['Waiting'],
+                tags = ('Waiting',),
             )
+            await_args: list[methods.Convenience.Argument | str] = [w for w in wait]
+            await_args.append('wake=self._waker()')
             ty.check_name('__await__')
             ty.convenience['__await__'] = methods.Convenience(
                 spec_name = None,
                 py_name = '__await__',
-                args = [w for w in wait],
-                py_result = 'typing.Awaitable[None]',
+                args = await_args,
+                py_result = 'typing.Generator[typing.Any, None, None]',
                 py_impl = 'backend._await',
                 doc = AWAIT_DOCS,
                 doc_rest = True,
-                tags = ['Waiting'],
+                tags = ('Waiting',),
             )
 
     def resolve_schema(self, schema: spec.SchemaLike) -> spec.Schema:
@@ -345,8 +351,7 @@ class Resolver:
         keyed = KEYED_TYPES.get(py_name)
         synced = None
         if keyed and parent is not None:
-            keyed = dataclasses.replace(keyed)
-            keyed.name = parent + '.' + keyed.name
+            keyed = keyed._replace(name=parent + '.' + keyed.name)
             synced = keyed.foreign
 
         ty = Type(
@@ -362,7 +367,7 @@ class Resolver:
             convenience = {},
         )
 
-        properties = PROPERTIES.get(py_name, {})
+        properties = PROPERTIES.get(py_name, EMPTY)
         if keyed and keyed.local != keyed.foreign:
             props_with_key = {keyed.foreign: 'self.' + keyed.local}
             props_with_key.update(properties)
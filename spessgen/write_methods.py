@@ -31,7 +31,7 @@ class WriteMethods(writer.Writer):
                 fmtpath += f'{{{argname}:s}}'
         return fmtpath
 
-    def _collect_args(self, var: str, args: list[methods.Method.Argument], json=False) -> None:
+    def _collect_args(self, var: str, args: typing.Sequence[methods.Method.Argument], json=False) -> None:
         if not args:
             return
         with self.print(f'{var} = {{'):
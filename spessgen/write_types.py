@@ -86,15 +86,19 @@ class WriteTypes(write_methods.WriteMethods):
             self.write_convenience_method(type, conv, banner=banner)
 
     def _write_struct(self, type: types.Type, struct: types.Struct, children: types.Resolver.IterTypes) -> None:
+        # models are made by the thousand, so skip the per-instance dict
         dataclass_args: dict[str, typing.Any] = {}
         base_classes = []
         if type.convenience:
             base_classes.append('LocalClient')
+        if '__await__' in type.convenience:
+            base_classes.append('Waitable')
         if type.keyed:
             base_classes.append(f'Keyed[{type.keyed.name}]')
             dataclass_args['eq'] = False
         elif type.synced:
             base_classes.append('Synced')
+        dataclass_args['slots'] = True
 
         base = ''
         if base_classes:
@@ -147,6 +151,9 @@ class WriteTypes(write_methods.WriteMethods):
                     converted = f'v[{field.json_name!r}]'
                     if field.py_type != 'Json':
                         converted = f'from_json({field.py_type}, {converted})'
+                    if field.py_type == 'str' and field.py_name.endswith('symbol'):
+                        # the same few symbols repeat across thousands of models
+                        converted = f'sys.intern({converted})'
                     if field.optional:
                         self.print(f'{field.py_name} = {converted} if {field.json_name!r} in v else None,')
                     else: